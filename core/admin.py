@@ -3,6 +3,7 @@ from .models import (
     GanjoorPoet, GanjoorCategory, GanjoorPoem, GanjoorVerse,
     GanjoorFavorite, GanjoorPoemAudio, GanjoorAudioSync, UserSetting
 )
+from .admin_paginator import EstimatedCountPaginator
 
 @admin.register(GanjoorPoet)
 class GanjoorPoetAdmin(admin.ModelAdmin):
@@ -12,39 +13,87 @@ class GanjoorPoetAdmin(admin.ModelAdmin):
 @admin.register(GanjoorCategory)
 class GanjoorCategoryAdmin(admin.ModelAdmin):
     list_display = ('title', 'poet', 'parent')
+    list_select_related = ('poet', 'parent')
     search_fields = ('title',)
     list_filter = ('poet',)
 
 @admin.register(GanjoorPoem)
 class GanjoorPoemAdmin(admin.ModelAdmin):
     list_display = ('title', 'category')
+    list_select_related = ('category',)
     search_fields = ('title',)
     list_filter = ('category',)
 
+    def get_queryset(self, request):
+        # The search columns hold the text of every verse; they are not shown
+        return super().get_queryset(request).defer('search_corpus', 'search_vec')
+
 @admin.register(GanjoorVerse)
 class GanjoorVerseAdmin(admin.ModelAdmin):
-    list_display = ('poem', 'order')
+    list_display = ('poem', 'order', 'text_preview')
+    list_select_related = ('poem',)
     search_fields = ('poem__title', 'text')
-    list_filter = ('poem',)
+    raw_id_fields = ('poem',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Rows are displayed through text_preview; skip the full text, and
+        # the poem's search columns
+        return super().get_queryset(request).defer(
+            'text', 'poem__search_corpus', 'poem__search_vec'
+        )
 
 @admin.register(GanjoorFavorite)
 class GanjoorFavoriteAdmin(admin.ModelAdmin):
     list_display = ('user', 'poem', 'verse', 'created_at')
+    list_select_related = ('user', 'poem', 'verse__poem')
     search_fields = ('user__username', 'poem__title')
-    list_filter = ('user', 'poem')
+    autocomplete_fields = ('user', 'poem', 'verse')
+
+    def get_queryset(self, request):
+        # Verses are displayed through text_preview; skip the full text, and
+        # the poems' search columns
+        return super().get_queryset(request).defer(
+            'verse__text',
+            'poem__search_corpus', 'poem__search_vec',
+            'verse__poem__search_corpus', 'verse__poem__search_vec',
+        )
 
 @admin.register(GanjoorPoemAudio)
 class GanjoorPoemAudioAdmin(admin.ModelAdmin):
     list_display = ('poem', 'file', 'is_uploaded')
+    list_select_related = ('poem',)
     search_fields = ('poem__title', 'description')
     list_filter = ('is_uploaded',)
+    raw_id_fields = ('poem',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Only the poem title is shown; skip the poem's search columns
+        return super().get_queryset(request).defer(
+            'poem__search_corpus', 'poem__search_vec'
+        )
 
 @admin.register(GanjoorAudioSync)
 class GanjoorAudioSyncAdmin(admin.ModelAdmin):
     list_display = ('poem', 'audio', 'verse_order', 'millisec')
-    list_filter = ('poem', 'audio')
+    list_select_related = ('poem', 'audio__poem')
+    search_fields = ('poem__title',)
+    raw_id_fields = ('poem', 'audio')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Only the poem titles are shown; skip the poems' search columns
+        return super().get_queryset(request).defer(
+            'poem__search_corpus', 'poem__search_vec',
+            'audio__poem__search_corpus', 'audio__poem__search_vec',
+        )
 
 @admin.register(UserSetting)
 class UserSettingAdmin(admin.ModelAdmin):
     list_display = ('user', 'view_mode', 'font_size', 'show_line_numbers')
+    list_select_related = ('user',)
     search_fields = ('user__username',)
\ No newline at end of file
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
-    verbose_name = "Ganjoor Poetry"
\ No newline at end of file
+    verbose_name = "Ganjoor Poetry"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -24,6 +24,157 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Static parts of the error response bodies; handlers copy them and add
+# the per-error detail
+_NOT_FOUND_BODY = {
+    "error": "not_found",
+    "message": "آیتم درخواستی یافت نشد.",
+    "message_en": "The requested item was not found.",
+}
+_PAGE_NOT_FOUND_BODY = {
+    "error": "not_found",
+    "message": "صفحه درخواستی یافت نشد.",
+    "message_en": "The requested page was not found.",
+}
+_INTEGRITY_ERROR_BODY = {
+    "error": "integrity_error",
+    "message": "خطا در ذخیره‌سازی اطلاعات. ممکن است این آیتم قبلاً وجود داشته باشد.",
+    "message_en": "Data integrity error. The item may already exist.",
+}
+_SERVER_ERROR_BODY = {
+    "error": "server_error",
+    "message": "خطای سرور. لطفاً بعداً تلاش کنید.",
+    "message_en": "Internal server error. Please try again later.",
+}
+_VALIDATION_ERROR_BODY = {
+    "error": "validation_error",
+    "message": "خطا در اعتبارسنجی داده‌ها.",
+    "message_en": "Validation error.",
+}
+_AUTHENTICATION_ERROR_BODY = {
+    "error": "authentication_error",
+    "message": "خطا در احراز هویت. لطفاً وارد شوید.",
+    "message_en": "Authentication error. Please login.",
+}
+_PERMISSION_DENIED_BODY = {
+    "error": "permission_denied",
+    "message": "شما اجازه دسترسی به این بخش را ندارید.",
+    "message_en": "You do not have permission to access this resource.",
+}
+_THROTTLED_BODY = {
+    "error": "throttled",
+    "message": "تعداد درخواست‌های شما بیش از حد مجاز است. لطفاً کمی صبر کنید.",
+    "message_en": "Request limit exceeded. Please wait before trying again.",
+}
+_GENERIC_ERROR_BODY = {
+    "error": "error",
+    "message": "خطایی رخ داده است.",
+    "message_en": "An error occurred.",
+}
+
+
+def _handle_object_does_not_exist(exc, is_staff):
+    return Response(
+        {**_NOT_FOUND_BODY, "detail": str(exc)}, status=status.HTTP_404_NOT_FOUND
+    )
+
+
+def _handle_http404(exc, is_staff):
+    return Response(
+        {**_PAGE_NOT_FOUND_BODY, "detail": str(exc)},
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def _handle_integrity_error(exc, is_staff):
+    return Response(
+        {**_INTEGRITY_ERROR_BODY, "detail": str(exc) if is_staff else None},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _handle_server_error(exc, is_staff):
+    return Response(
+        {**_SERVER_ERROR_BODY, "detail": str(exc) if is_staff else None},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+def _handle_validation_error(exc, response):
+    return {**_VALIDATION_ERROR_BODY, "errors": response.data}
+
+
+def _handle_not_found(exc, response):
+    return {**_NOT_FOUND_BODY, "detail": response.data.get("detail", str(exc))}
+
+
+def _handle_authentication_error(exc, response):
+    return {
+        **_AUTHENTICATION_ERROR_BODY,
+        "detail": response.data.get("detail", str(exc)),
+    }
+
+
+def _handle_permission_denied(exc, response):
+    return {
+        **_PERMISSION_DENIED_BODY,
+        "detail": response.data.get("detail", str(exc)),
+    }
+
+
+def _handle_method_not_allowed(exc, response):
+    return {
+        "error": "method_not_allowed",
+        "message": f"متد {exc.method} برای این درخواست مجاز نیست.",
+        "message_en": f"Method {exc.method} is not allowed for this request.",
+        "detail": response.data.get("detail", str(exc)),
+    }
+
+
+def _handle_throttled(exc, response):
+    return {
+        **_THROTTLED_BODY,
+        "detail": response.data.get("detail", str(exc)),
+        "wait_seconds": getattr(exc, "wait", None),
+    }
+
+
+def _handle_generic_error(exc, response):
+    # Keep responses that already have the custom structure
+    if "error" in response.data:
+        return response.data
+    return {
+        **_GENERIC_ERROR_BODY,
+        "detail": response.data.get("detail", response.data)
+        if response.data
+        else str(exc),
+    }
+
+
+# Handlers for exceptions DRF does not turn into a response, checked in order
+_UNHANDLED_EXCEPTION_HANDLERS = (
+    (ObjectDoesNotExist, _handle_object_does_not_exist),
+    (Http404, _handle_http404),
+    (IntegrityError, _handle_integrity_error),
+)
+
+# Handlers that restructure the data of DRF's response, checked in order
+_RESPONSE_HANDLERS = (
+    (ValidationError, _handle_validation_error),
+    (NotFound, _handle_not_found),
+    ((AuthenticationFailed, NotAuthenticated), _handle_authentication_error),
+    (PermissionDenied, _handle_permission_denied),
+    (MethodNotAllowed, _handle_method_not_allowed),
+    (Throttled, _handle_throttled),
+)
+
+
+def _find_handler(handlers, exc, default):
+    for exc_types, handler in handlers:
+        if isinstance(exc, exc_types):
+            return handler
+    return default
+
 
 def custom_exception_handler(exc, context):
     """
@@ -43,159 +194,44 @@ def custom_exception_handler(exc, context):
     view = context.get("view", None)
     request = context.get("request", None)
 
+    # Resolve these once; request.user may hit the database on first access
+    view_name = view.__class__.__name__ if view else None
+    request_path = request.path if request else None
+    request_method = request.method if request else None
+    user = getattr(request, "user", None)
+    is_staff = bool(user and getattr(user, "is_staff", False))
+
     # If response is None, it's an unhandled exception
     if response is None:
-        # Handle Django's ObjectDoesNotExist
-        if isinstance(exc, ObjectDoesNotExist):
-            response = Response(
-                {
-                    "error": "not_found",
-                    "message": "آیتم درخواستی یافت نشد.",
-                    "message_en": "The requested item was not found.",
-                    "detail": str(exc),
-                },
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Handle Django's Http404
-        elif isinstance(exc, Http404):
-            response = Response(
-                {
-                    "error": "not_found",
-                    "message": "صفحه درخواستی یافت نشد.",
-                    "message_en": "The requested page was not found.",
-                    "detail": str(exc),
-                },
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Handle database integrity errors
-        elif isinstance(exc, IntegrityError):
-            response = Response(
-                {
-                    "error": "integrity_error",
-                    "message": "خطا در ذخیره‌سازی اطلاعات. ممکن است این آیتم قبلاً وجود داشته باشد.",
-                    "message_en": "Data integrity error. The item may already exist.",
-                    "detail": str(exc)
-                    if request
-                    and hasattr(request.user, "is_staff")
-                    and request.user.is_staff
-                    else None,
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Handle all other unhandled exceptions
-        else:
+        handler = _find_handler(_UNHANDLED_EXCEPTION_HANDLERS, exc, None)
+        if handler is None:
             logger.error(
                 f"Unhandled exception: {exc.__class__.__name__}: {str(exc)}",
                 exc_info=True,
                 extra={
-                    "view": view.__class__.__name__ if view else None,
-                    "request_path": request.path if request else None,
-                    "request_method": request.method if request else None,
+                    "view": view_name,
+                    "request_path": request_path,
+                    "request_method": request_method,
                 },
             )
-
-            response = Response(
-                {
-                    "error": "server_error",
-                    "message": "خطای سرور. لطفاً بعداً تلاش کنید.",
-                    "message_en": "Internal server error. Please try again later.",
-                    "detail": str(exc)
-                    if request
-                    and hasattr(request.user, "is_staff")
-                    and request.user.is_staff
-                    else None,
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+            handler = _handle_server_error
+        response = handler(exc, is_staff)
 
     # Customize the response data structure
     if response is not None:
-        custom_response_data = {}
-
-        # Handle validation errors
-        if isinstance(exc, ValidationError):
-            custom_response_data = {
-                "error": "validation_error",
-                "message": "خطا در اعتبارسنجی داده‌ها.",
-                "message_en": "Validation error.",
-                "errors": response.data,
-            }
-
-        # Handle not found errors
-        elif isinstance(exc, NotFound):
-            custom_response_data = {
-                "error": "not_found",
-                "message": "آیتم درخواستی یافت نشد.",
-                "message_en": "The requested item was not found.",
-                "detail": response.data.get("detail", str(exc)),
-            }
-
-        # Handle authentication errors
-        elif isinstance(exc, (AuthenticationFailed, NotAuthenticated)):
-            custom_response_data = {
-                "error": "authentication_error",
-                "message": "خطا در احراز هویت. لطفاً وارد شوید.",
-                "message_en": "Authentication error. Please login.",
-                "detail": response.data.get("detail", str(exc)),
-            }
-
-        # Handle permission errors
-        elif isinstance(exc, PermissionDenied):
-            custom_response_data = {
-                "error": "permission_denied",
-                "message": "شما اجازه دسترسی به این بخش را ندارید.",
-                "message_en": "You do not have permission to access this resource.",
-                "detail": response.data.get("detail", str(exc)),
-            }
-
-        # Handle method not allowed
-        elif isinstance(exc, MethodNotAllowed):
-            custom_response_data = {
-                "error": "method_not_allowed",
-                "message": f"متد {exc.method} برای این درخواست مجاز نیست.",
-                "message_en": f"Method {exc.method} is not allowed for this request.",
-                "detail": response.data.get("detail", str(exc)),
-            }
-
-        # Handle throttling
-        elif isinstance(exc, Throttled):
-            wait_time = exc.wait if hasattr(exc, "wait") else None
-            custom_response_data = {
-                "error": "throttled",
-                "message": "تعداد درخواست‌های شما بیش از حد مجاز است. لطفاً کمی صبر کنید.",
-                "message_en": "Request limit exceeded. Please wait before trying again.",
-                "detail": response.data.get("detail", str(exc)),
-                "wait_seconds": wait_time,
-            }
-
-        # Handle generic errors
-        else:
-            # Check if response data already has custom structure
-            if "error" not in response.data:
-                custom_response_data = {
-                    "error": "error",
-                    "message": "خطایی رخ داده است.",
-                    "message_en": "An error occurred.",
-                    "detail": response.data.get("detail", response.data)
-                    if response.data
-                    else str(exc),
-                }
-            else:
-                custom_response_data = response.data
+        handler = _find_handler(_RESPONSE_HANDLERS, exc, _handle_generic_error)
+        custom_response_data = handler(exc, response)
 
         # Update response data
         if custom_response_data:
             response.data = custom_response_data
 
         # Add request information for debugging (only for staff users)
-        if request and hasattr(request.user, "is_staff") and request.user.is_staff:
+        if is_staff:
             response.data["_debug"] = {
-                "path": request.path,
-                "method": request.method,
-                "view": view.__class__.__name__ if view else None,
+                "path": request_path,
+                "method": request_method,
+                "view": view_name,
             }
 
     return response
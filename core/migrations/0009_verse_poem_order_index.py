@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='ganjoorverse',
+            name='unique_verse_per_poem',
+        ),
+        migrations.AlterField(
+            model_name='ganjoorverse',
+            name='order',
+            field=models.PositiveIntegerField(help_text='Order of the verse in the poem', verbose_name='Order'),
+        ),
+        migrations.AlterField(
+            model_name='ganjoorverse',
+            name='poem',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='verses', to='core.ganjoorpoem', verbose_name='Poem'),
+        ),
+        migrations.AddConstraint(
+            model_name='ganjoorverse',
+            constraint=models.UniqueConstraint(fields=('poem', 'order'), name='unique_verse_per_poem'),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:15
+
+from django.db import migrations, models
+
+# Bit of each former boolean column in button_flags
+BUTTON_BITS = {
+    'browse_button_visible': 1 << 0,
+    'comments_button_visible': 1 << 1,
+    'copy_button_visible': 1 << 2,
+    'print_button_visible': 1 << 3,
+    'home_button_visible': 1 << 4,
+    'random_button_visible': 1 << 5,
+    'editor_button_visible': 1 << 6,
+    'download_button_visible': 1 << 7,
+}
+
+
+def fold_button_flags(apps, schema_editor):
+    UserSetting = apps.get_model('core', 'UserSetting')
+    settings = list(UserSetting.objects.all())
+    for setting in settings:
+        setting.button_flags = sum(
+            bit for name, bit in BUTTON_BITS.items() if getattr(setting, name)
+        )
+    UserSetting.objects.bulk_update(settings, ['button_flags'], batch_size=1000)
+
+
+def unfold_button_flags(apps, schema_editor):
+    UserSetting = apps.get_model('core', 'UserSetting')
+    settings = list(UserSetting.objects.all())
+    for setting in settings:
+        for name, bit in BUTTON_BITS.items():
+            setattr(setting, name, bool(setting.button_flags & bit))
+    UserSetting.objects.bulk_update(settings, list(BUTTON_BITS), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_verse_poem_order_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersetting',
+            name='button_flags',
+            field=models.PositiveSmallIntegerField(default=255, help_text='Bitmask of visible toolbar buttons', verbose_name='Button Flags'),
+        ),
+        migrations.RunPython(fold_button_flags, unfold_button_flags),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='browse_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='comments_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='copy_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='download_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='editor_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='home_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='print_button_visible',
+        ),
+        migrations.RemoveField(
+            model_name='usersetting',
+            name='random_button_visible',
+        ),
+    ]
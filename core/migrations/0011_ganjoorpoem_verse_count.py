@@ -0,0 +1,75 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:17
+
+from django.db import migrations, models
+
+# Statement-level triggers keep ganjoor_poem.verse_count in sync with the
+# verses table, aggregating the rows touched by each statement so bulk
+# inserts update every poem once instead of once per verse.
+CREATE_TRIGGERS = """
+CREATE FUNCTION ganjoor_verse_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE ganjoor_poem p SET verse_count = p.verse_count + d.delta
+        FROM (SELECT poem_id, count(*) AS delta FROM new_rows GROUP BY poem_id) d
+        WHERE p.id = d.poem_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE ganjoor_poem p SET verse_count = p.verse_count - d.delta
+        FROM (SELECT poem_id, count(*) AS delta FROM old_rows GROUP BY poem_id) d
+        WHERE p.id = d.poem_id;
+    ELSE
+        UPDATE ganjoor_poem p SET verse_count = p.verse_count + d.delta
+        FROM (
+            SELECT poem_id, sum(delta) AS delta FROM (
+                SELECT n.poem_id, 1 AS delta
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE o.poem_id <> n.poem_id
+                UNION ALL
+                SELECT o.poem_id, -1 AS delta
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE o.poem_id <> n.poem_id
+            ) moved
+            GROUP BY poem_id
+        ) d
+        WHERE p.id = d.poem_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ganjoor_verse_count_insert AFTER INSERT ON ganjoor_verse
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_count();
+CREATE TRIGGER ganjoor_verse_count_delete AFTER DELETE ON ganjoor_verse
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_count();
+CREATE TRIGGER ganjoor_verse_count_update AFTER UPDATE ON ganjoor_verse
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_count();
+
+UPDATE ganjoor_poem p SET verse_count = v.count
+FROM (SELECT poem_id, count(*) AS count FROM ganjoor_verse GROUP BY poem_id) v
+WHERE p.id = v.poem_id;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER ganjoor_verse_count_insert ON ganjoor_verse;
+DROP TRIGGER ganjoor_verse_count_delete ON ganjoor_verse;
+DROP TRIGGER ganjoor_verse_count_update ON ganjoor_verse;
+DROP FUNCTION ganjoor_verse_count();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_usersetting_button_flags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ganjoorpoem',
+            name='verse_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of verses, maintained by database triggers', verbose_name='Verse Count'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_ganjoorpoem_verse_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ganjoorcategory',
+            name='title',
+            field=models.CharField(max_length=255, verbose_name='Title'),
+        ),
+        migrations.AlterField(
+            model_name='ganjoorpoem',
+            name='url',
+            field=models.CharField(max_length=255, verbose_name='URL'),
+        ),
+        migrations.AlterField(
+            model_name='ganjoorpoemaudio',
+            name='sync_guid',
+            field=models.CharField(max_length=255, unique=True, verbose_name='Sync GUID'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_index_cleanup'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='ganjoorverse',
+            constraint=models.CheckConstraint(condition=models.Q(('position__in', [0, 1, 2, 3, 4, 5, -1])), name='verse_position_valid'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:26
+
+from django.db import migrations
+
+# LZ4 decompresses several times faster than the default pglz, which
+# matters for a table read on every poem page and search. It needs
+# PostgreSQL 14+ built with lz4; on other servers the column keeps the
+# default compression. Only newly written values are affected.
+SET_LZ4 = """
+DO $$
+BEGIN
+    EXECUTE 'ALTER TABLE ganjoor_verse ALTER COLUMN text SET COMPRESSION lz4';
+EXCEPTION WHEN feature_not_supported OR syntax_error THEN
+    RAISE NOTICE 'lz4 compression not available, keeping default for ganjoor_verse.text';
+END;
+$$;
+"""
+
+RESET_COMPRESSION = """
+DO $$
+BEGIN
+    EXECUTE 'ALTER TABLE ganjoor_verse ALTER COLUMN text SET COMPRESSION default';
+EXCEPTION WHEN syntax_error THEN
+    NULL;
+END;
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_verse_position_check'),
+    ]
+
+    operations = [
+        migrations.RunSQL(SET_LZ4, RESET_COMPRESSION),
+    ]
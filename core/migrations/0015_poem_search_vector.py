@@ -0,0 +1,88 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# ganjoor_poem.search_vec holds the words of a poem's title and verses using
+# the 'simple' configuration (no stemming, which suits Persian text). It is
+# set by a row trigger when a poem is written, and recomputed by
+# statement-level triggers for the poems touched by each verse statement.
+CREATE_TRIGGERS = """
+CREATE FUNCTION ganjoor_poem_search_vec(poem_id bigint, title text)
+RETURNS tsvector AS $$
+    SELECT to_tsvector('pg_catalog.simple', coalesce(title, '') || ' ' || coalesce(
+        (SELECT string_agg(v.text, ' ' ORDER BY v."order")
+         FROM ganjoor_verse v WHERE v.poem_id = $1),
+        ''
+    ))
+$$ LANGUAGE sql STABLE;
+
+CREATE FUNCTION ganjoor_poem_search_vec_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vec := ganjoor_poem_search_vec(NEW.id, NEW.title);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION ganjoor_verse_search_vec() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE ganjoor_poem p SET search_vec = ganjoor_poem_search_vec(p.id, p.title)
+        WHERE p.id IN (SELECT poem_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE ganjoor_poem p SET search_vec = ganjoor_poem_search_vec(p.id, p.title)
+        WHERE p.id IN (SELECT poem_id FROM old_rows);
+    ELSE
+        UPDATE ganjoor_poem p SET search_vec = ganjoor_poem_search_vec(p.id, p.title)
+        WHERE p.id IN (SELECT poem_id FROM new_rows UNION SELECT poem_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ganjoor_poem_search_vec BEFORE INSERT OR UPDATE OF title
+    ON ganjoor_poem
+    FOR EACH ROW EXECUTE FUNCTION ganjoor_poem_search_vec_trigger();
+CREATE TRIGGER ganjoor_verse_search_vec_insert AFTER INSERT ON ganjoor_verse
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_search_vec();
+CREATE TRIGGER ganjoor_verse_search_vec_delete AFTER DELETE ON ganjoor_verse
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_search_vec();
+CREATE TRIGGER ganjoor_verse_search_vec_update AFTER UPDATE ON ganjoor_verse
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_search_vec();
+
+UPDATE ganjoor_poem SET search_vec = ganjoor_poem_search_vec(id, title);
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER ganjoor_poem_search_vec ON ganjoor_poem;
+DROP TRIGGER ganjoor_verse_search_vec_insert ON ganjoor_verse;
+DROP TRIGGER ganjoor_verse_search_vec_delete ON ganjoor_verse;
+DROP TRIGGER ganjoor_verse_search_vec_update ON ganjoor_verse;
+DROP FUNCTION ganjoor_verse_search_vec();
+DROP FUNCTION ganjoor_poem_search_vec_trigger();
+DROP FUNCTION ganjoor_poem_search_vec(bigint, text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_verse_text_lz4'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ganjoorpoem',
+            name='search_vec',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Words of the title and verses, maintained by database triggers', null=True, verbose_name='Search Vector'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.AddIndex(
+            model_name='ganjoorpoem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vec'], name='poem_search_vec'),
+        ),
+    ]
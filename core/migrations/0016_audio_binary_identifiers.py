@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:32
+
+from django.db import migrations, models
+
+# Checksums were stored hex-encoded; decode them to the raw digest bytes
+# rather than letting the type change keep the hex text as bytes.
+CHECKSUM_TO_BYTES = """
+ALTER TABLE ganjoor_poem_audio
+    ALTER COLUMN file_checksum TYPE bytea USING decode(file_checksum, 'hex');
+"""
+
+CHECKSUM_TO_HEX = """
+ALTER TABLE ganjoor_poem_audio
+    ALTER COLUMN file_checksum TYPE varchar(255) USING encode(file_checksum, 'hex');
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_poem_search_vector'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(CHECKSUM_TO_BYTES, CHECKSUM_TO_HEX),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='ganjoorpoemaudio',
+                    name='file_checksum',
+                    field=models.BinaryField(max_length=32, verbose_name='File Checksum'),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='ganjoorpoemaudio',
+            name='sync_guid',
+            field=models.UUIDField(unique=True, verbose_name='Sync GUID'),
+        ),
+    ]
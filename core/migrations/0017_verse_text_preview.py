@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:34
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_audio_binary_identifiers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ganjoorverse',
+            name='text_preview',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Substr('text', 1, 20), output_field=models.CharField(max_length=20), verbose_name='Text Preview'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:36
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# ganjoor_category.path is derived from parent_id: a row trigger computes it
+# from the parent's path when a category is inserted or re-parented, and
+# rewrites the prefix of the moved subtree's paths afterwards.
+CREATE_TRIGGERS = """
+CREATE FUNCTION ganjoor_category_path() RETURNS trigger AS $$
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.path := NEW.id || '/';
+    ELSE
+        SELECT path || NEW.id || '/' INTO NEW.path
+        FROM ganjoor_category WHERE id = NEW.parent_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION ganjoor_category_move_subtree() RETURNS trigger AS $$
+BEGIN
+    UPDATE ganjoor_category
+    SET path = NEW.path || substr(path, length(OLD.path) + 1)
+    WHERE path LIKE OLD.path || '%' AND id <> NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ganjoor_category_path BEFORE INSERT OR UPDATE OF parent_id
+    ON ganjoor_category
+    FOR EACH ROW EXECUTE FUNCTION ganjoor_category_path();
+CREATE TRIGGER ganjoor_category_move_subtree AFTER UPDATE OF parent_id
+    ON ganjoor_category
+    FOR EACH ROW WHEN (OLD.path IS DISTINCT FROM NEW.path)
+    EXECUTE FUNCTION ganjoor_category_move_subtree();
+
+WITH RECURSIVE tree (id, path) AS (
+    SELECT id, id || '/' FROM ganjoor_category WHERE parent_id IS NULL
+    UNION ALL
+    SELECT c.id, t.path || c.id || '/'
+    FROM ganjoor_category c JOIN tree t ON c.parent_id = t.id
+)
+UPDATE ganjoor_category c SET path = tree.path FROM tree WHERE c.id = tree.id;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER ganjoor_category_path ON ganjoor_category;
+DROP TRIGGER ganjoor_category_move_subtree ON ganjoor_category;
+DROP FUNCTION ganjoor_category_path();
+DROP FUNCTION ganjoor_category_move_subtree();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_verse_text_preview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ganjoorcategory',
+            name='path',
+            field=models.CharField(default='', editable=False, max_length=255, verbose_name='Path'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.AddIndex(
+            model_name='ganjoorcategory',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('path', name='varchar_pattern_ops'), name='category_path'),
+        ),
+    ]
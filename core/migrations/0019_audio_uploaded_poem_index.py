@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_category_path'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ganjoorpoemaudio',
+            index=models.Index(condition=models.Q(('is_uploaded', True)), fields=['poem'], name='audio_uploaded_poem_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_audio_uploaded_poem_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='ganjoorfavorite',
+            name='unique_user_poem_verse_fav',
+        ),
+        migrations.AlterField(
+            model_name='ganjoorfavorite',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='ganjoor_favorites', to=settings.AUTH_USER_MODEL, verbose_name='User'),
+        ),
+        migrations.AddConstraint(
+            model_name='ganjoorfavorite',
+            constraint=models.UniqueConstraint(fields=('user', 'verse'), name='unique_user_verse_fav'),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:52
+
+from importlib import import_module
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# The search_vec triggers of 0015 are replaced: verse triggers now keep the
+# poem's search_corpus up to date, and search_vec becomes a stored generated
+# column over title and search_corpus.
+search_vec_triggers = import_module('core.migrations.0015_poem_search_vector')
+
+# Verses are joined with newlines so substring searches do not match across
+# the end of one verse and the start of the next.
+CREATE_TRIGGERS = """
+CREATE FUNCTION ganjoor_poem_search_corpus(poem_id bigint) RETURNS text AS $$
+    SELECT coalesce(string_agg(v.text, E'\\n' ORDER BY v."order"), '')
+    FROM ganjoor_verse v WHERE v.poem_id = $1
+$$ LANGUAGE sql STABLE;
+
+CREATE FUNCTION ganjoor_verse_search_corpus() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE ganjoor_poem p SET search_corpus = ganjoor_poem_search_corpus(p.id)
+        WHERE p.id IN (SELECT poem_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE ganjoor_poem p SET search_corpus = ganjoor_poem_search_corpus(p.id)
+        WHERE p.id IN (SELECT poem_id FROM old_rows);
+    ELSE
+        UPDATE ganjoor_poem p SET search_corpus = ganjoor_poem_search_corpus(p.id)
+        WHERE p.id IN (SELECT poem_id FROM new_rows UNION SELECT poem_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ganjoor_verse_search_corpus_insert AFTER INSERT ON ganjoor_verse
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_search_corpus();
+CREATE TRIGGER ganjoor_verse_search_corpus_delete AFTER DELETE ON ganjoor_verse
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_search_corpus();
+CREATE TRIGGER ganjoor_verse_search_corpus_update AFTER UPDATE ON ganjoor_verse
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_verse_search_corpus();
+
+UPDATE ganjoor_poem SET search_corpus = ganjoor_poem_search_corpus(id)
+WHERE id IN (SELECT poem_id FROM ganjoor_verse);
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER ganjoor_verse_search_corpus_insert ON ganjoor_verse;
+DROP TRIGGER ganjoor_verse_search_corpus_delete ON ganjoor_verse;
+DROP TRIGGER ganjoor_verse_search_corpus_update ON ganjoor_verse;
+DROP FUNCTION ganjoor_verse_search_corpus();
+DROP FUNCTION ganjoor_poem_search_corpus(bigint);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_favorite_user_verse_unique'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            search_vec_triggers.DROP_TRIGGERS, search_vec_triggers.CREATE_TRIGGERS
+        ),
+        migrations.RemoveIndex(
+            model_name='ganjoorpoem',
+            name='poem_search_vec',
+        ),
+        migrations.RemoveField(
+            model_name='ganjoorpoem',
+            name='search_vec',
+        ),
+        migrations.AddField(
+            model_name='ganjoorpoem',
+            name='search_corpus',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Text of all verses, maintained by database triggers', verbose_name='Search Corpus'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.AddField(
+            model_name='ganjoorpoem',
+            name='search_vec',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('title', 'search_corpus', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField(), verbose_name='Search Vector'),
+        ),
+        migrations.AddIndex(
+            model_name='ganjoorpoem',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('search_corpus'), name='gin_trgm_ops'), name='poem_search_corpus_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='ganjoorpoem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vec'], name='poem_search_vec'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_poem_search_corpus'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ganjoorpoem',
+            name='title',
+            field=models.CharField(max_length=255, verbose_name='Title'),
+        ),
+        migrations.AddIndex(
+            model_name='ganjoorpoem',
+            index=models.Index(fields=['title', 'id'], name='poem_title_id'),
+        ),
+    ]
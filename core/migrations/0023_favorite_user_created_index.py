@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_poem_title_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ganjoorfavorite',
+            index=models.Index(fields=['user', '-created_at'], name='favorite_user_created'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:16
+
+from django.db import migrations, models
+
+# Statement-level triggers keep ganjoor_category.poem_count in sync with the
+# poems table, like ganjoor_poem.verse_count (0011).
+CREATE_TRIGGERS = """
+CREATE FUNCTION ganjoor_poem_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE ganjoor_category c SET poem_count = c.poem_count + d.delta
+        FROM (SELECT category_id, count(*) AS delta FROM new_rows GROUP BY category_id) d
+        WHERE c.id = d.category_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE ganjoor_category c SET poem_count = c.poem_count - d.delta
+        FROM (SELECT category_id, count(*) AS delta FROM old_rows GROUP BY category_id) d
+        WHERE c.id = d.category_id;
+    ELSE
+        UPDATE ganjoor_category c SET poem_count = c.poem_count + d.delta
+        FROM (
+            SELECT category_id, sum(delta) AS delta FROM (
+                SELECT n.category_id, 1 AS delta
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE o.category_id <> n.category_id
+                UNION ALL
+                SELECT o.category_id, -1 AS delta
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE o.category_id <> n.category_id
+            ) moved
+            GROUP BY category_id
+        ) d
+        WHERE c.id = d.category_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ganjoor_poem_count_insert AFTER INSERT ON ganjoor_poem
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_poem_count();
+CREATE TRIGGER ganjoor_poem_count_delete AFTER DELETE ON ganjoor_poem
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_poem_count();
+CREATE TRIGGER ganjoor_poem_count_update AFTER UPDATE ON ganjoor_poem
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ganjoor_poem_count();
+
+UPDATE ganjoor_category c SET poem_count = p.count
+FROM (SELECT category_id, count(*) AS count FROM ganjoor_poem GROUP BY category_id) p
+WHERE c.id = p.category_id;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER ganjoor_poem_count_insert ON ganjoor_poem;
+DROP TRIGGER ganjoor_poem_count_delete ON ganjoor_poem;
+DROP TRIGGER ganjoor_poem_count_update ON ganjoor_poem;
+DROP FUNCTION ganjoor_poem_count();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_favorite_user_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ganjoorcategory',
+            name='poem_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of poems directly in the category, maintained by database triggers', verbose_name='Poem Count'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
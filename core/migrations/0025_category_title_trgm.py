@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:23
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Built concurrently, without locking the categories table against writes
+    atomic = False
+
+    dependencies = [
+        ('core', '0024_category_poem_count'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='ganjoorcategory',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='category_title_trgm'),
+        ),
+    ]
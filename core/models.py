@@ -1,19 +1,109 @@
+import re
+from itertools import islice
+
 from django.contrib.auth.models import User
-from django.db import models
-from django.db.models import Q
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.core.cache import cache
+from django.db import connection, models, transaction
+from django.db.models import Count, F, Func, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, Substr, Upper
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
+def related_label(instance, field_name, attr):
+    """
+    Return ``attr`` of a related object for use in ``__str__``.
+
+    Falls back to the related id when the object was not loaded with
+    select_related(), so that printing a list of instances (shell, admin,
+    logging) never runs a query per row.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return getattr(getattr(instance, field_name), attr)
+    return f"#{getattr(instance, field.attname)}"
+
+
+def exclude_trigger_fields(instance, kwargs):
+    """
+    Limit the save() of an existing ``instance`` to the fields not written
+    by database triggers (the model's ``TRIGGER_FIELDS``), so they are not
+    overwritten with the possibly stale values loaded on the instance.
+    """
+    if (
+        not instance._state.adding
+        and not kwargs.get("force_insert")
+        and kwargs.get("update_fields") is None
+    ):
+        kwargs["update_fields"] = [
+            field.name
+            for field in instance._meta.concrete_fields
+            if not (field.primary_key or field.generated)
+            and field.name not in instance.TRIGGER_FIELDS
+        ]
+
+
+def bulk_create_batched(model, objs, batch_size):
+    """
+    Insert ``objs`` in batches of ``batch_size`` inside one transaction,
+    skipping rows that conflict with existing ones.
+
+    Unlike a plain bulk_create(), ``objs`` can be a generator: only one
+    batch of instances is held in memory at a time. Returns the number of
+    instances sent to the database.
+    """
+    objs = iter(objs)
+    count = 0
+    with transaction.atomic():
+        while batch := list(islice(objs, batch_size)):
+            model.objects.bulk_create(batch, ignore_conflicts=True)
+            count += len(batch)
+        # bulk_create() sends no signals
+        if count:
+            transaction.on_commit(touch_catalog)
+    return count
+
+
+CATALOG_MODIFIED_KEY = "catalog:last_modified"
+
+
+def catalog_last_modified():
+    """
+    Return when the catalog (poets, categories, poems, verses and audio
+    files) last changed, as recorded by touch_catalog(). Without a
+    recorded time (e.g. after a cache flush) the current time is recorded
+    and returned.
+    """
+    modified = cache.get(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        cache.add(CATALOG_MODIFIED_KEY, timezone.now(), None)
+        modified = cache.get(CATALOG_MODIFIED_KEY)
+    return modified
+
+
+def touch_catalog():
+    """Record that the catalog changed (see core.signals)."""
+    cache.set(CATALOG_MODIFIED_KEY, timezone.now(), None)
+
+
 # -------------------
 # Poet
 # -------------------
 class GanjoorPoet(models.Model):
-    CENTURY_CHOICES = [
+    CENTURY_CHOICES = (
         ("ancient", _("Ancient")),
         ("classical", _("Classical")),
         ("contemporary", _("Contemporary")),
         ("modern", _("Modern")),
-    ]
+    )
     name = models.CharField(max_length=255, db_index=True, verbose_name=_("Name"))
     description = models.TextField(blank=True, verbose_name=_("Description"))
     century = models.CharField(
@@ -43,9 +133,106 @@ class GanjoorPoet(models.Model):
         verbose_name = _("Poet")
         verbose_name_plural = _("Poets")
 
+    COUNTS_CACHE_TIMEOUT = 60 * 60
+    ALL_CACHE_KEY = "poets:all"
+    ALL_CACHE_TIMEOUT = 60 * 60 * 24
+
     def __str__(self):
         return self.name
 
+    @classmethod
+    def get_all_cached(cls):
+        """
+        Return all poets ordered by name, with the columns the home page and
+        poet pickers show.
+
+        The list is cached and dropped whenever a poet is saved or deleted
+        (see core.signals).
+        """
+        poets = cache.get(cls.ALL_CACHE_KEY)
+        if poets is None:
+            poets = list(
+                cls.objects.only(
+                    "id", "name", "century", "description", "image_slug"
+                ).order_by("name")
+            )
+            cache.set(cls.ALL_CACHE_KEY, poets, cls.ALL_CACHE_TIMEOUT)
+        return poets
+
+    @staticmethod
+    def counts_cache_key(poet_id):
+        return f"poet:{poet_id}:counts"
+
+    @cached_property
+    def counts(self):
+        """
+        Return the numbers of categories and poems of the poet, as a dict
+        with ``categories_count`` and ``poems_count`` keys.
+
+        The counts are cached and dropped whenever a category or poem of the
+        poet is saved or deleted (see core.signals).
+        """
+        key = self.counts_cache_key(self.pk)
+        counts = cache.get(key)
+        if counts is None:
+            counts = GanjoorPoet.objects.filter(pk=self.pk).aggregate(
+                categories_count=Count("categories"),
+                poems_count=Coalesce(Sum("categories__poem_count"), 0),
+            )
+            cache.set(key, counts, self.COUNTS_CACHE_TIMEOUT)
+        return counts
+
+
+# -------------------
+# Category QuerySet
+# -------------------
+class GanjoorCategoryQuerySet(models.QuerySet):
+    def with_poems_count(self):
+        """
+        Annotate ``poems_count_ann``: the number of poems in each category
+        and all of its subcategories, summed from the ``poem_count`` of the
+        subtree found through the materialized path.
+        """
+        counts = (
+            GanjoorCategory.objects.filter(
+                poet=OuterRef("poet"), path__startswith=OuterRef("path")
+            )
+            .order_by()
+            .values("poet")
+            .annotate(count=Sum("poem_count"))
+            .values("count")
+        )
+        return self.annotate(poems_count_ann=Coalesce(Subquery(counts), 0))
+
+    def refresh_poem_counts(self):
+        """
+        Recompute ``poem_count`` from the poems table, for loads that
+        bypassed the database triggers.
+        """
+        counts = (
+            GanjoorPoem.objects.filter(category=OuterRef("pk"))
+            .order_by()
+            .values("category")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return self.update(poem_count=Coalesce(Subquery(counts), 0))
+
+    def for_list(self):
+        """
+        Load only the columns shown in category listings, together with the
+        poet and parent names.
+        """
+        return self.select_related("poet", "parent").only(
+            "id",
+            "title",
+            "url",
+            "poet__id",
+            "poet__name",
+            "parent__id",
+            "parent__title",
+        )
+
 
 # -------------------
 # Category
@@ -57,7 +244,7 @@ class GanjoorCategory(models.Model):
         related_name="categories",
         verbose_name=_("Poet"),
     )
-    title = models.CharField(max_length=255, db_index=True, verbose_name=_("Title"))
+    title = models.CharField(max_length=255, verbose_name=_("Title"))
     parent = models.ForeignKey(
         "self",
         on_delete=models.CASCADE,
@@ -67,27 +254,182 @@ class GanjoorCategory(models.Model):
         verbose_name=_("Parent Category"),
     )
     url = models.CharField(max_length=255, blank=True, null=True, verbose_name=_("URL"))
+    # Materialized path of ids from the root, e.g. "10/11/", maintained by
+    # database triggers from parent
+    path = models.CharField(
+        max_length=255, default="", editable=False, verbose_name=_("Path")
+    )
+    poem_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=_(
+            "Number of poems directly in the category, maintained by database "
+            "triggers"
+        ),
+        verbose_name=_("Poem Count"),
+    )
+
+    objects = GanjoorCategoryQuerySet.as_manager()
+
+    # Columns written by database triggers; save() must not overwrite them
+    # with the possibly stale values loaded on the instance
+    TRIGGER_FIELDS = ("poem_count",)
 
     class Meta:
         db_table = "ganjoor_category"
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
+        indexes = [
+            # Serves path LIKE 'prefix%' subtree lookups
+            models.Index(
+                OpClass("path", name="varchar_pattern_ops"), name="category_path"
+            ),
+            # Trigram index for the API's ?search= (title__icontains)
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="category_title_trgm",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        exclude_trigger_fields(self, kwargs)
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "parent" in update_fields:
+            # The path was computed by the database trigger
+            self.refresh_from_db(fields=["path"])
+
+    @property
+    def ancestor_ids(self):
+        """Ids of the ancestors of this category, from the root down."""
+        return [int(pk) for pk in self.path.split("/")[:-2]]
+
+    def get_ancestors(self):
+        """Return the ancestors of this category from the root down."""
+        ids = self.ancestor_ids
+        if not ids:
+            return []
+        ancestors = GanjoorCategory.objects.in_bulk(ids)
+        return [ancestors[pk] for pk in ids if pk in ancestors]
+
+    def get_descendants(self, include_self=False):
+        """Return all categories below this one with one index range scan."""
+        descendants = GanjoorCategory.objects.filter(path__startswith=self.path)
+        if not include_self:
+            descendants = descendants.exclude(pk=self.pk)
+        return descendants
+
+    @classmethod
+    def rebuild_paths(cls):
+        """
+        Recompute every path from the parent links, for loads that bypassed
+        the database triggers. Returns the number of updated categories.
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                WITH RECURSIVE tree (id, path) AS (
+                    SELECT id, id || '/' FROM {table} WHERE parent_id IS NULL
+                    UNION ALL
+                    SELECT c.id, t.path || c.id || '/'
+                    FROM {table} c JOIN tree t ON c.parent_id = t.id
+                )
+                UPDATE {table} c SET path = tree.path FROM tree
+                WHERE c.id = tree.id AND c.path <> tree.path
+                """)
+            return cursor.rowcount
+
 
 # -------------------
 # Poem QuerySet
 # -------------------
 class GanjoorPoemQuerySet(models.QuerySet):
+    # Queries made of a single word are answered from the search_vec index
+    WORD_QUERY = re.compile(r"\w+")
+
     def search(self, query, poet_id=None):
+        """
+        Return the poems matching ``query`` in their title or verses, best
+        matches first for single words and by title otherwise.
+        """
         qs = self
         if poet_id:
             qs = qs.filter(category__poet_id=poet_id)
-        return qs.filter(
-            Q(title__icontains=query) | Q(verses__text__icontains=query)
-        ).distinct()
+        if self.WORD_QUERY.fullmatch(query):
+            search_query = SearchQuery(query, config="simple")
+            return (
+                qs.filter(search_vec=search_query)
+                .annotate(rank=SearchRank(F("search_vec"), search_query))
+                .order_by("-rank", "title", "id")
+                .for_list()
+            )
+        # Substring match through the trigram indexes, on the poem table alone
+        return (
+            qs.filter(Q(title__icontains=query) | Q(search_corpus__icontains=query))
+            .order_by("title", "id")
+            .for_list()
+        )
+
+    def for_list(self):
+        """
+        Load only the columns shown in poem listings, together with the
+        category and poet names, leaving out the large search columns.
+        """
+        return self.select_related("category__poet").only(
+            "id",
+            "title",
+            "url",
+            "verse_count",
+            "category__id",
+            "category__title",
+            "category__poet__id",
+            "category__poet__name",
+        )
+
+    def with_first_verses(self, n=50):
+        """
+        Prefetch the first ``n`` verses of each poem into ``head_verses``.
+
+        The slice is applied in the database (a window function per poem), so
+        long poems do not load all of their verses.
+        """
+        verses = GanjoorVerse.objects.only(
+            "id", "poem_id", "order", "position", "text"
+        ).order_by("order")
+        return self.prefetch_related(
+            Prefetch("verses", queryset=verses[:n], to_attr="head_verses")
+        )
+
+    def refresh_verse_counts(self):
+        """
+        Recompute ``verse_count`` from the verses table.
+
+        The counter is normally kept up to date by database triggers; this is
+        for loads that bypass them (e.g. session_replication_role = replica).
+        """
+        counts = (
+            GanjoorVerse.objects.filter(poem=OuterRef("pk"))
+            .order_by()
+            .values("poem")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return self.update(verse_count=Coalesce(Subquery(counts), 0))
+
+    def refresh_search_corpus(self):
+        """
+        Rebuild ``search_corpus`` for loads that bypassed the database triggers.
+        """
+        return self.update(
+            search_corpus=Func(
+                F("id"),
+                function="ganjoor_poem_search_corpus",
+                output_field=models.TextField(),
+            )
+        )
 
 
 # -------------------
@@ -100,19 +442,61 @@ class GanjoorPoem(models.Model):
         related_name="poems",
         verbose_name=_("Category"),
     )
-    title = models.CharField(max_length=255, db_index=True, verbose_name=_("Title"))
-    url = models.CharField(max_length=255, db_index=True, verbose_name=_("URL"))
+    title = models.CharField(max_length=255, verbose_name=_("Title"))
+    url = models.CharField(max_length=255, verbose_name=_("URL"))
+    verse_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=_("Number of verses, maintained by database triggers"),
+        verbose_name=_("Verse Count"),
+    )
+    search_corpus = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("Text of all verses, maintained by database triggers"),
+        verbose_name=_("Search Corpus"),
+    )
+    search_vec = models.GeneratedField(
+        expression=SearchVector("title", "search_corpus", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        verbose_name=_("Search Vector"),
+    )
 
     objects = GanjoorPoemQuerySet.as_manager()
 
+    # Columns written by database triggers; save() must not overwrite them
+    # with the possibly stale values loaded on the instance
+    TRIGGER_FIELDS = ("verse_count", "search_corpus")
+
     class Meta:
         db_table = "ganjoor_poem"
         verbose_name = _("Poem")
         verbose_name_plural = _("Poems")
+        indexes = [
+            # Trigram index for title__icontains, which compiles to
+            # UPPER(title) LIKE UPPER('%...%') on PostgreSQL
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="poem_title_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("search_corpus"), name="gin_trgm_ops"),
+                name="poem_search_corpus_trgm",
+            ),
+            GinIndex(fields=["search_vec"], name="poem_search_vec"),
+            # Keyset pagination by (title, id); also serves title lookups
+            models.Index(fields=["title", "id"], name="poem_title_id"),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        exclude_trigger_fields(self, kwargs)
+        super().save(*args, **kwargs)
+
 
 # -------------------
 # Verse Position Enum
@@ -131,15 +515,17 @@ class VersePosition(models.IntegerChoices):
 # Verse
 # -------------------
 class GanjoorVerse(models.Model):
+    # Both lookups by poem and by (poem, order) are served by the
+    # unique_verse_per_poem index
     poem = models.ForeignKey(
         GanjoorPoem,
         on_delete=models.CASCADE,
         related_name="verses",
+        db_index=False,
         verbose_name=_("Poem"),
     )
     order = models.PositiveIntegerField(
         help_text=_("Order of the verse in the poem"),
-        db_index=True,
         verbose_name=_("Order"),
     )
     position = models.SmallIntegerField(
@@ -148,29 +534,71 @@ class GanjoorVerse(models.Model):
         verbose_name=_("Position"),
     )
     text = models.TextField(verbose_name=_("Text"))
+    # Stored prefix of the text for list displays, so they do not have to
+    # detoast the whole verse
+    text_preview = models.GeneratedField(
+        expression=Substr("text", 1, 20),
+        output_field=models.CharField(max_length=20),
+        db_persist=True,
+        verbose_name=_("Text Preview"),
+    )
 
     class Meta:
         db_table = "ganjoor_verse"
         constraints = [
             models.UniqueConstraint(
-                fields=["order", "poem"], name="unique_verse_per_poem"
-            )
+                fields=["poem", "order"], name="unique_verse_per_poem"
+            ),
+            # Reject unknown positions in the database, keeping the compact
+            # smallint column (a native ENUM would take 4 bytes per row)
+            models.CheckConstraint(
+                condition=Q(position__in=VersePosition.values),
+                name="verse_position_valid",
+            ),
+        ]
+        indexes = [
+            # Trigram index for text__icontains searches
+            GinIndex(
+                OpClass(Upper("text"), name="gin_trgm_ops"),
+                name="verse_text_trgm",
+            ),
         ]
         ordering = ["order"]
 
+    @classmethod
+    def bulk_import(cls, poem, verses, batch_size=10000):
+        """
+        Create the verses of ``poem`` from ``(position, text)`` pairs,
+        numbering them from 1 in iteration order.
+
+        Existing verses with the same order are left untouched. Returns the
+        number of verses sent to the database.
+        """
+        return bulk_create_batched(
+            cls,
+            (
+                cls(poem=poem, order=order, position=position, text=text)
+                for order, (position, text) in enumerate(verses, start=1)
+            ),
+            batch_size,
+        )
+
     def __str__(self):
-        return f"{self.poem.title} [{self.order}] {self.text[:20]}..."
+        poem = related_label(self, "poem", "title")
+        return f"{poem} [{self.order}] {self.text_preview}..."
 
 
 # -------------------
 # Favorite
 # -------------------
 class GanjoorFavorite(models.Model):
+    # Lookups by user are served by the unique_user_verse_fav and
+    # favorite_user_created indexes
     user = models.ForeignKey(
         User,
         related_name="ganjoor_favorites",
         on_delete=models.CASCADE,
-        db_index=True,
+        db_index=False,
         verbose_name=_("User"),
     )
     poem = models.ForeignKey(
@@ -192,13 +620,38 @@ class GanjoorFavorite(models.Model):
         verbose_name = _("Favorite")
         verbose_name_plural = _("Favorites")
         constraints = [
+            # A verse belongs to a single poem, so poem is left out of the key
             models.UniqueConstraint(
-                fields=["user", "poem", "verse"], name="unique_user_poem_verse_fav"
+                fields=["user", "verse"], name="unique_user_verse_fav"
             )
         ]
+        indexes = [
+            # A user's favorites, newest first, without a sort
+            models.Index(fields=["user", "-created_at"], name="favorite_user_created"),
+        ]
 
     def __str__(self):
-        return f"{self.user.username} → {self.poem.title}"
+        user = related_label(self, "user", "username")
+        return f"{user} → {related_label(self, 'poem', 'title')}"
+
+    @classmethod
+    def remove(cls, user_id, poem_id, verse_id):
+        """
+        Delete the user's favorite for the verse, if any, and return whether
+        it existed.
+
+        This is the hot path of toggling, so it runs a fixed DELETE statement
+        instead of compiling a queryset and running the deletion collector
+        on every call.
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} "
+                "WHERE user_id = %s AND poem_id = %s AND verse_id = %s",
+                [user_id, poem_id, verse_id],
+            )
+            return cursor.rowcount > 0
 
 
 # -------------------
@@ -215,19 +668,27 @@ class GanjoorPoemAudio(models.Model):
     description = models.TextField(blank=True, null=True, verbose_name=_("Description"))
     download_url = models.URLField(max_length=500, verbose_name=_("Download URL"))
     is_direct = models.BooleanField(default=False, verbose_name=_("Is Direct"))
-    sync_guid = models.CharField(
-        max_length=255, db_index=True, verbose_name=_("Sync GUID")
-    )
-    file_checksum = models.CharField(max_length=255, verbose_name=_("File Checksum"))
+    sync_guid = models.UUIDField(unique=True, verbose_name=_("Sync GUID"))
+    # Raw digest bytes: 16 for MD5, 32 for SHA-256
+    file_checksum = models.BinaryField(max_length=32, verbose_name=_("File Checksum"))
     is_uploaded = models.BooleanField(default=False, verbose_name=_("Is Uploaded"))
 
     class Meta:
         db_table = "ganjoor_poem_audio"
         verbose_name = _("Poem Audio")
         verbose_name_plural = _("Poem Audios")
+        indexes = [
+            # Players only list uploaded audios; the FK index still serves
+            # cascades and unfiltered lookups
+            models.Index(
+                fields=["poem"],
+                condition=Q(is_uploaded=True),
+                name="audio_uploaded_poem_idx",
+            ),
+        ]
 
     def __str__(self):
-        return f"Audio for {self.poem.title}"
+        return f"Audio for {related_label(self, 'poem', 'title')}"
 
 
 # -------------------
@@ -254,13 +715,48 @@ class GanjoorAudioSync(models.Model):
         verbose_name = _("Audio Sync")
         verbose_name_plural = _("Audio Syncs")
 
+    @classmethod
+    def bulk_import(cls, audio, syncs, batch_size=10000):
+        """
+        Create sync points for ``audio`` from ``(verse_order, millisec)``
+        pairs. Returns the number of sync points sent to the database.
+        """
+        return bulk_create_batched(
+            cls,
+            (
+                cls(
+                    poem_id=audio.poem_id,
+                    audio=audio,
+                    verse_order=verse_order,
+                    millisec=millisec,
+                )
+                for verse_order, millisec in syncs
+            ),
+            batch_size,
+        )
+
     def __str__(self):
-        return f"Sync {self.poem.title} @ {self.verse_order}"
+        return f"Sync {related_label(self, 'poem', 'title')} @ {self.verse_order}"
 
 
 # -------------------
 # User Setting
 # -------------------
+def button_flag(mask):
+    """Boolean property stored as the ``mask`` bit of ``button_flags``."""
+
+    def getter(self):
+        return bool(self.button_flags & mask)
+
+    def setter(self, value):
+        if value:
+            self.button_flags |= mask
+        else:
+            self.button_flags &= ~mask
+
+    return property(getter, setter)
+
+
 class UserSetting(models.Model):
     user = models.OneToOneField(
         User,
@@ -278,34 +774,47 @@ class UserSetting(models.Model):
     last_highlight = models.CharField(
         max_length=255, blank=True, null=True, verbose_name=_("Last Highlight")
     )
-    browse_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Browse Button Visible")
-    )
-    comments_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Comments Button Visible")
-    )
-    copy_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Copy Button Visible")
-    )
-    print_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Print Button Visible")
-    )
-    home_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Home Button Visible")
-    )
-    random_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Random Button Visible")
-    )
-    editor_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Editor Button Visible")
-    )
-    download_button_visible = models.BooleanField(
-        default=True, verbose_name=_("Download Button Visible")
+    button_flags = models.PositiveSmallIntegerField(
+        default=0xFF,
+        help_text=_("Bitmask of visible toolbar buttons"),
+        verbose_name=_("Button Flags"),
     )
 
+    browse_button_visible = button_flag(1 << 0)
+    comments_button_visible = button_flag(1 << 1)
+    copy_button_visible = button_flag(1 << 2)
+    print_button_visible = button_flag(1 << 3)
+    home_button_visible = button_flag(1 << 4)
+    random_button_visible = button_flag(1 << 5)
+    editor_button_visible = button_flag(1 << 6)
+    download_button_visible = button_flag(1 << 7)
+
+    # Settings are read on every page for the UI chrome and rarely change
+    CACHE_TIMEOUT = 60 * 60
+
     class Meta:
         verbose_name = _("User Setting")
         verbose_name_plural = _("User Settings")
 
+    @staticmethod
+    def cache_key(user_id):
+        return f"usersetting:{user_id}"
+
+    @classmethod
+    def get_for_user(cls, user):
+        """
+        Return the settings of ``user``, served from the cache when possible.
+
+        Raises ``UserSetting.DoesNotExist`` if the user has no settings. The
+        cached copy is dropped whenever the settings are saved or deleted
+        (see core.signals).
+        """
+        key = cls.cache_key(user.pk)
+        setting = cache.get(key)
+        if setting is None:
+            setting = cls.objects.get(user=user)
+            cache.set(key, setting, cls.CACHE_TIMEOUT)
+        return setting
+
     def __str__(self):
-        return f"Settings for {self.user.username}"
+        return f"Settings for {related_label(self, 'user', 'username')}"
@@ -0,0 +1,31 @@
+"""
+Paginators for the Ganjoor API.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+from .serializers import POEM_LIST_COLUMNS
+
+
+class PoemCursorPagination(CursorPagination):
+    """
+    Keyset pagination of poem lists by title.
+
+    Each page seeks past the last title of the previous one through the
+    (title, id) index, so deep pages cost the same as the first instead of
+    reading and skipping OFFSET rows.
+
+    Pages may hold the ``values_list(*POEM_LIST_COLUMNS)`` rows of
+    poem_list_response().
+    """
+
+    ordering = ("title", "id")
+
+    def get_ordering(self, request, queryset, view):
+        # Always the indexed ordering, never the OrderingFilter of the view
+        return self.ordering
+
+    def _get_position_from_instance(self, instance, ordering):
+        if isinstance(instance, tuple):
+            instance = dict(zip(POEM_LIST_COLUMNS, instance))
+        return super()._get_position_from_instance(instance, ordering)
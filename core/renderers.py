@@ -0,0 +1,46 @@
+"""
+Renderers for the Ganjoor API.
+
+orjson is optional; without it responses are rendered by DRF's stdlib
+based JSONRenderer.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Types orjson does not handle natively (lazy translation strings,
+    Decimal, ...) and datetimes go through DRF's JSONEncoder, so the output
+    matches JSONRenderer. Indented output, as requested by the browsable
+    API, is left to JSONRenderer since orjson only indents by two spaces.
+    """
+
+    options = (
+        (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+    )
+
+    def __init__(self):
+        self.default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.default, option=self.options)
+        # Escape U+2028 and U+2029 like JSONRenderer, keeping the output a
+        # strict javascript subset
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -6,7 +6,11 @@ with proper field definitions, validation, and nested representations.
 """
 
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from .models import (
@@ -19,9 +23,63 @@ from .models import (
     GanjoorAudioSync,
     UserSetting,
     VersePosition,
+    touch_catalog,
 )
 
 
+# -------------------
+# Absolute URLs
+# -------------------
+def absolute_url(context, url):
+    """
+    Return ``url`` made absolute against the request in serializer
+    ``context``, like request.build_absolute_uri().
+
+    The scheme and host prefix is built once and kept in the context (which
+    the serializers of a list share), so lists do not rebuild it per row.
+    """
+    request = context.get("request")
+    if request is None:
+        return url
+    if not url.startswith("/") or url.startswith("//"):
+        return request.build_absolute_uri(url)
+    prefix = context.get("abs_prefix")
+    if prefix is None:
+        prefix = context["abs_prefix"] = request.build_absolute_uri("/")[:-1]
+    return prefix + url
+
+
+# -------------------
+# Field Selection
+# -------------------
+def is_field_requested(request, name):
+    """
+    Return whether field ``name`` is selected by the ``fields`` and ``omit``
+    query parameters of ``request``, e.g. ``?fields=id,title``.
+    """
+    params = request.query_params
+    if "fields" in params and name not in params["fields"].split(","):
+        return False
+    return name not in params.get("omit", "").split(",")
+
+
+class DynamicFieldsMixin:
+    """
+    Drop the fields not selected with ``?fields=`` / ``?omit=`` from GET
+    responses, so their values (and the queries behind them) are never
+    computed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method != "GET":
+            return
+        for name in list(self.fields):
+            if not is_field_requested(request, name):
+                self.fields.pop(name)
+
+
 # -------------------
 # User Serializer
 # -------------------
@@ -37,6 +95,20 @@ class UserSerializer(serializers.ModelSerializer):
 # -------------------
 # Poet Serializers
 # -------------------
+def poet_poems_count(poet):
+    """
+    Return the number of poems of ``poet``, read from the
+    ``poems_count_ann`` annotation of the viewset queryset when present.
+
+    Instances that were not annotated (e.g. poet detail, after create or
+    update) fall back to the cached counts of the poet.
+    """
+    count = getattr(poet, "poems_count_ann", None)
+    if count is None:
+        count = poet.counts["poems_count"]
+    return count
+
+
 class GanjoorPoetListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for poet list views."""
 
@@ -49,7 +121,7 @@ class GanjoorPoetListSerializer(serializers.ModelSerializer):
 
     def get_poems_count(self, obj):
         """Get total number of poems for this poet."""
-        return GanjoorPoem.objects.filter(category__poet=obj).count()
+        return poet_poems_count(obj)
 
 
 class GanjoorPoetSerializer(serializers.ModelSerializer):
@@ -78,11 +150,14 @@ class GanjoorPoetSerializer(serializers.ModelSerializer):
 
     def get_categories_count(self, obj):
         """Get total number of categories for this poet."""
-        return obj.categories.count()
+        count = getattr(obj, "categories_count_ann", None)
+        if count is None:
+            count = obj.counts["categories_count"]
+        return count
 
     def get_poems_count(self, obj):
         """Get total number of poems for this poet."""
-        return GanjoorPoem.objects.filter(category__poet=obj).count()
+        return poet_poems_count(obj)
 
     def validate_name(self, value):
         """Validate poet name is not empty."""
@@ -94,6 +169,19 @@ class GanjoorPoetSerializer(serializers.ModelSerializer):
 # -------------------
 # Category Serializers
 # -------------------
+def category_poems_count(category):
+    """
+    Return the number of poems in ``category`` and its subcategories, read
+    from the ``poems_count_ann`` annotation when present.
+    """
+    count = getattr(category, "poems_count_ann", None)
+    if count is None:
+        count = category.get_descendants(include_self=True).aggregate(
+            count=Coalesce(Sum("poem_count"), 0)
+        )["count"]
+    return count
+
+
 class GanjoorCategoryListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for category list views."""
 
@@ -110,12 +198,7 @@ class GanjoorCategoryListSerializer(serializers.ModelSerializer):
 
     def get_poems_count(self, obj):
         """Get total number of poems in this category and all subcategories."""
-        def count_poems(category):
-            count = category.poems.count()
-            for child in category.children.all():
-                count += count_poems(child)
-            return count
-        return count_poems(obj)
+        return category_poems_count(obj)
 
 
 class GanjoorCategorySerializer(serializers.ModelSerializer):
@@ -149,31 +232,24 @@ class GanjoorCategorySerializer(serializers.ModelSerializer):
 
     def get_children(self, obj):
         """Get child categories."""
-        children = obj.children.all()
+        children = obj.children.for_list().with_poems_count()
         return GanjoorCategoryListSerializer(children, many=True).data
 
     def get_poems(self, obj):
         """Get poems directly in this category."""
-        poems = obj.poems.select_related("category__poet").order_by("title")
-        return GanjoorPoemListSerializer(poems, many=True, context=self.context).data
+        poems = obj.poems.order_by("title").values_list(*POEM_LIST_COLUMNS)
+        return [serialize_poem_row(row) for row in poems]
 
     def get_poems_count(self, obj):
         """Get total number of poems in this category and all subcategories."""
-        def count_poems(category):
-            count = category.poems.count()
-            for child in category.children.all():
-                count += count_poems(child)
-            return count
-        return count_poems(obj)
+        return category_poems_count(obj)
 
     def get_breadcrumbs(self, obj):
         """Get breadcrumb trail for this category."""
-        breadcrumbs = []
-        current = obj
-        while current:
-            breadcrumbs.insert(0, {"id": current.id, "title": current.title})
-            current = current.parent
-        return breadcrumbs
+        return [
+            {"id": category.id, "title": category.title}
+            for category in [*obj.get_ancestors(), obj]
+        ]
 
     def validate_title(self, value):
         """Validate category title is not empty."""
@@ -185,6 +261,53 @@ class GanjoorCategorySerializer(serializers.ModelSerializer):
 # -------------------
 # Verse Serializers
 # -------------------
+# Rows per INSERT when a list is posted, keeping each statement well under
+# PostgreSQL's limit of 65535 query parameters
+BULK_CREATE_BATCH_SIZE = 500
+
+
+class GanjoorVerseListSerializer(serializers.ListSerializer):
+    """
+    Creates many verses at once, checking all of them against existing
+    verses with one query and inserting them with one bulk_create().
+    """
+
+    @property
+    def duplicate_message(self):
+        return self.child.duplicate_message
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+        keys = [(item["poem"].pk, item["order"]) for item in attrs]
+        taken = set(
+            GanjoorVerse.objects.filter(
+                poem__in={poem_id for poem_id, _order in keys},
+                order__in={order for _poem_id, order in keys},
+            ).values_list("poem", "order")
+        )
+        errors = []
+        for key in keys:
+            if key in taken:
+                errors.append(
+                    {api_settings.NON_FIELD_ERRORS_KEY: [self.duplicate_message]}
+                )
+            else:
+                errors.append({})
+                taken.add(key)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def create(self, validated_data):
+        verses = GanjoorVerse.objects.bulk_create(
+            (GanjoorVerse(**item) for item in validated_data),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+        # bulk_create() sends no signals
+        transaction.on_commit(touch_catalog)
+        return verses
+
+
 class GanjoorVerseSerializer(serializers.ModelSerializer):
     """Serializer for verses with position information."""
 
@@ -192,10 +315,16 @@ class GanjoorVerseSerializer(serializers.ModelSerializer):
         source="get_position_display", read_only=True
     )
 
+    # Reported by the viewset when saving violates unique_verse_per_poem
+    duplicate_message = _("A verse with this order already exists in this poem.")
+
     class Meta:
         model = GanjoorVerse
         fields = ["id", "poem", "order", "position", "position_display", "text"]
         read_only_fields = ["id"]
+        # Uniqueness of (poem, order) is enforced by the database constraint
+        validators = []
+        list_serializer_class = GanjoorVerseListSerializer
 
     def validate_text(self, value):
         """Validate verse text is not empty."""
@@ -211,27 +340,52 @@ class GanjoorVerseSerializer(serializers.ModelSerializer):
             )
         return value
 
-    def validate(self, data):
-        """Validate verse doesn't duplicate order in same poem."""
-        if self.instance is None:  # Creating new verse
-            poem = data.get("poem")
-            order = data.get("order")
-            if GanjoorVerse.objects.filter(poem=poem, order=order).exists():
-                raise serializers.ValidationError(
-                    _("A verse with this order already exists in this poem.")
-                )
-        return data
-
 
 # -------------------
 # Poem Serializers
 # -------------------
+# Columns of the values_list() rows read by serialize_poem_row()
+POEM_LIST_COLUMNS = (
+    "id",
+    "title",
+    "url",
+    "category",
+    "category__title",
+    "category__poet__name",
+    "verse_count",
+)
+
+
+def serialize_poem_row(row):
+    """
+    Build the GanjoorPoemListSerializer representation of a
+    ``values_list(*POEM_LIST_COLUMNS)`` row.
+
+    Poem lists can run to thousands of rows; this skips building model
+    instances and DRF's per-field dispatch.
+    """
+    return {
+        "id": row[0],
+        "title": row[1],
+        "url": row[2],
+        "category": row[3],
+        "category_title": row[4],
+        "poet_name": row[5],
+        "verses_count": row[6],
+    }
+
+
 class GanjoorPoemListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for poem list views."""
+    """
+    Lightweight serializer for poem list views.
+
+    The list endpoints render through serialize_poem_row(); this serializer
+    documents the response schema.
+    """
 
     poet_name = serializers.CharField(source="category.poet.name", read_only=True)
     category_title = serializers.CharField(source="category.title", read_only=True)
-    verses_count = serializers.SerializerMethodField()
+    verses_count = serializers.IntegerField(source="verse_count", read_only=True)
 
     class Meta:
         model = GanjoorPoem
@@ -246,19 +400,15 @@ class GanjoorPoemListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id"]
 
-    def get_verses_count(self, obj):
-        """Get number of verses in this poem."""
-        return obj.verses.count()
-
 
-class GanjoorPoemSerializer(serializers.ModelSerializer):
+class GanjoorPoemSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer for individual poem views with verses."""
 
     poet_name = serializers.CharField(source="category.poet.name", read_only=True)
     poet_id = serializers.IntegerField(source="category.poet.id", read_only=True)
     category_title = serializers.CharField(source="category.title", read_only=True)
     verses = GanjoorVerseSerializer(many=True, read_only=True)
-    verses_count = serializers.SerializerMethodField()
+    verses_count = serializers.IntegerField(source="verse_count", read_only=True)
     audios = serializers.SerializerMethodField()
 
     class Meta:
@@ -277,13 +427,12 @@ class GanjoorPoemSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id"]
 
-    def get_verses_count(self, obj):
-        """Get number of verses in this poem."""
-        return obj.verses.count()
-
     def get_audios(self, obj):
         """Get audio files for this poem."""
-        audios = obj.audios.filter(is_uploaded=True)
+        # Prefetched by the viewset into uploaded_audios
+        audios = getattr(obj, "uploaded_audios", None)
+        if audios is None:
+            audios = obj.audios.filter(is_uploaded=True)
         return GanjoorPoemAudioSerializer(audios, many=True).data
 
     def validate_title(self, value):
@@ -296,13 +445,57 @@ class GanjoorPoemSerializer(serializers.ModelSerializer):
 # -------------------
 # Favorite Serializers
 # -------------------
+class GanjoorFavoriteListSerializer(serializers.ListSerializer):
+    """
+    Adds many favorites of the requesting user at once, checking all of them
+    against the user's favorites with one query and inserting them with one
+    bulk_create().
+    """
+
+    @property
+    def duplicate_message(self):
+        return self.child.duplicate_message
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+        verse_ids = [item["verse"].pk for item in attrs]
+        taken = set(
+            GanjoorFavorite.objects.filter(
+                user=self.context["request"].user, verse__in=verse_ids
+            ).values_list("verse", flat=True)
+        )
+        errors = []
+        for verse_id in verse_ids:
+            if verse_id in taken:
+                errors.append(
+                    {api_settings.NON_FIELD_ERRORS_KEY: [self.duplicate_message]}
+                )
+            else:
+                errors.append({})
+                taken.add(verse_id)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def create(self, validated_data):
+        return GanjoorFavorite.objects.bulk_create(
+            (GanjoorFavorite(**item) for item in validated_data),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+
 class GanjoorFavoriteSerializer(serializers.ModelSerializer):
     """Serializer for user favorites."""
 
-    user_username = serializers.CharField(source="user.username", read_only=True)
-    poem_title = serializers.CharField(source="poem.title", read_only=True)
-    verse_text = serializers.CharField(source="verse.text", read_only=True)
-    poet_name = serializers.CharField(source="poem.category.poet.name", read_only=True)
+    # Reported by the viewset when saving violates unique_user_verse_fav
+    duplicate_message = _("This verse has already been added to favorites.")
+
+    # Declared for the schema, filled in by to_representation()
+    user_username = serializers.CharField(read_only=True)
+    poem_title = serializers.CharField(read_only=True)
+    verse_text = serializers.CharField(read_only=True)
+    poet_name = serializers.CharField(read_only=True)
+    related_names = ("user_username", "poem_title", "verse_text", "poet_name")
 
     class Meta:
         model = GanjoorFavorite
@@ -318,25 +511,39 @@ class GanjoorFavoriteSerializer(serializers.ModelSerializer):
             "created_at",
         ]
         read_only_fields = ["id", "user", "created_at"]
+        list_serializer_class = GanjoorFavoriteListSerializer
+
+    @property
+    def _readable_fields(self):
+        for field in super()._readable_fields:
+            if field.field_name not in self.related_names:
+                yield field
+
+    def to_representation(self, instance):
+        """
+        Add the names of the related objects with plain attribute access,
+        instead of a dotted ``source`` lookup per field. The viewset loads
+        them with select_related().
+        """
+        ret = super().to_representation(instance)
+        poem = instance.poem
+        ret["user_username"] = instance.user.username
+        ret["poem_title"] = poem.title
+        ret["verse_text"] = instance.verse.text
+        ret["poet_name"] = poem.category.poet.name
+        return ret
 
     def validate(self, data):
-        """Validate favorite doesn't already exist."""
-        user = self.context["request"].user
+        """Validate the verse belongs to the poem."""
         poem = data.get("poem")
         verse = data.get("verse")
 
         # Check if verse belongs to poem
-        if verse.poem != poem:
+        if verse.poem_id != poem.pk:
             raise serializers.ValidationError(
                 _("This verse does not belong to this poem.")
             )
 
-        # Check for duplicates
-        if GanjoorFavorite.objects.filter(user=user, poem=poem, verse=verse).exists():
-            raise serializers.ValidationError(
-                _("This verse has already been added to favorites.")
-            )
-
         return data
 
 
@@ -348,6 +555,7 @@ class GanjoorPoemAudioSerializer(serializers.ModelSerializer):
 
     poem_title = serializers.CharField(source="poem.title", read_only=True)
     file_url = serializers.SerializerMethodField()
+    file_checksum = serializers.SerializerMethodField()
 
     class Meta:
         model = GanjoorPoemAudio
@@ -368,13 +576,14 @@ class GanjoorPoemAudioSerializer(serializers.ModelSerializer):
 
     def get_file_url(self, obj):
         """Get absolute URL for audio file."""
-        request = self.context.get("request")
-        if obj.file and hasattr(obj.file, "url"):
-            if request:
-                return request.build_absolute_uri(obj.file.url)
-            return obj.file.url
+        if obj.file:
+            return absolute_url(self.context, obj.file.url)
         return None
 
+    def get_file_checksum(self, obj):
+        """Get the checksum as a hex string (stored as raw digest bytes)."""
+        return bytes(obj.file_checksum).hex()
+
     def validate_download_url(self, value):
         """Validate download URL format."""
         if not value.startswith(("http://", "https://")):
@@ -405,6 +614,9 @@ class GanjoorAudioSyncSerializer(serializers.ModelSerializer):
 
     def get_verse_text(self, obj):
         """Get verse text for this sync point."""
+        # Annotated by the viewset; a missing verse is annotated as None
+        if hasattr(obj, "verse_text_ann"):
+            return obj.verse_text_ann
         try:
             verse = obj.poem.verses.get(order=obj.verse_order)
             return verse.text
@@ -432,7 +644,7 @@ class GanjoorAudioSyncSerializer(serializers.ModelSerializer):
         verse_order = data.get("verse_order")
 
         # Check if audio belongs to poem
-        if audio.poem != poem:
+        if audio.poem_id != poem.pk:
             raise serializers.ValidationError(
                 _("This audio file does not belong to this poem.")
             )
@@ -449,11 +661,26 @@ class GanjoorAudioSyncSerializer(serializers.ModelSerializer):
 # -------------------
 # User Settings Serializer
 # -------------------
+VIEW_MODES = ("centered", "rtl", "ltr", "justified")
+_VIEW_MODE_SET = frozenset(VIEW_MODES)
+_VIEW_MODES_STR = ", ".join(VIEW_MODES)
+
+
 class UserSettingSerializer(serializers.ModelSerializer):
     """Serializer for user settings."""
 
     username = serializers.CharField(source="user.username", read_only=True)
 
+    # Stored as bits of UserSetting.button_flags
+    browse_button_visible = serializers.BooleanField(required=False)
+    comments_button_visible = serializers.BooleanField(required=False)
+    copy_button_visible = serializers.BooleanField(required=False)
+    print_button_visible = serializers.BooleanField(required=False)
+    home_button_visible = serializers.BooleanField(required=False)
+    random_button_visible = serializers.BooleanField(required=False)
+    editor_button_visible = serializers.BooleanField(required=False)
+    download_button_visible = serializers.BooleanField(required=False)
+
     class Meta:
         model = UserSetting
         fields = [
@@ -483,10 +710,8 @@ class UserSettingSerializer(serializers.ModelSerializer):
 
     def validate_view_mode(self, value):
         """Validate view mode is acceptable."""
-        valid_modes = ["centered", "rtl", "ltr", "justified"]
-        if value not in valid_modes:
+        if value not in _VIEW_MODE_SET:
             raise serializers.ValidationError(
-                _("View mode must be one of: %(modes)s")
-                % {"modes": ", ".join(valid_modes)}
+                _("View mode must be one of: %(modes)s") % {"modes": _VIEW_MODES_STR}
             )
         return value
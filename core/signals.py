@@ -0,0 +1,102 @@
+"""
+Signal handlers for the core app.
+
+Keeps cached copies of models in sync with the database.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import (
+    GanjoorCategory,
+    GanjoorPoem,
+    GanjoorPoemAudio,
+    GanjoorPoet,
+    GanjoorVerse,
+    UserSetting,
+    touch_catalog,
+)
+
+
+@receiver([post_save, post_delete], sender=UserSetting)
+def invalidate_user_setting_cache(sender, instance, **kwargs):
+    """Drop the cached settings of the user whose settings changed."""
+    cache.delete(UserSetting.cache_key(instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=GanjoorPoet)
+def invalidate_poet_list_cache(sender, instance, **kwargs):
+    """Drop the cached list of all poets."""
+    cache.delete(GanjoorPoet.ALL_CACHE_KEY)
+
+
+def drop_poet_counts(*poet_ids):
+    """Drop the cached counts of the given poets, skipping missing ids."""
+    cache.delete_many(
+        [GanjoorPoet.counts_cache_key(poet_id) for poet_id in set(poet_ids) if poet_id]
+    )
+
+
+@receiver(pre_save, sender=GanjoorCategory)
+def remember_category_poet(sender, instance, **kwargs):
+    """Record the poet a category belonged to before it is saved."""
+    instance._previous_poet_id = (
+        GanjoorCategory.objects.filter(pk=instance.pk)
+        .values_list("poet_id", flat=True)
+        .first()
+        if instance.pk is not None
+        else None
+    )
+
+
+@receiver([post_save, post_delete], sender=GanjoorCategory)
+def invalidate_poet_counts_for_category(sender, instance, **kwargs):
+    """
+    Drop the cached counts of the poet whose categories changed, and of the
+    poet a moved category left.
+    """
+    drop_poet_counts(instance.poet_id, getattr(instance, "_previous_poet_id", None))
+
+
+@receiver(pre_save, sender=GanjoorPoem)
+def remember_poem_poet(sender, instance, **kwargs):
+    """Record the poet of the category a poem was in before it is saved."""
+    instance._previous_poet_id = (
+        GanjoorPoem.objects.filter(pk=instance.pk)
+        .values_list("category__poet_id", flat=True)
+        .first()
+        if instance.pk is not None
+        else None
+    )
+
+
+@receiver([post_save, post_delete], sender=GanjoorPoem)
+def invalidate_poet_counts_for_poem(sender, instance, **kwargs):
+    """
+    Drop the cached counts of the poet whose poems changed, and of the poet
+    a moved poem left.
+    """
+    if GanjoorPoem._meta.get_field("category").is_cached(instance):
+        poet_id = instance.category.poet_id
+    else:
+        poet_id = (
+            GanjoorCategory.objects.filter(pk=instance.category_id)
+            .values_list("poet_id", flat=True)
+            .first()
+        )
+    drop_poet_counts(poet_id, getattr(instance, "_previous_poet_id", None))
+
+
+@receiver([post_save, post_delete], sender=GanjoorPoet)
+@receiver([post_save, post_delete], sender=GanjoorCategory)
+@receiver([post_save, post_delete], sender=GanjoorPoem)
+@receiver([post_save, post_delete], sender=GanjoorVerse)
+@receiver([post_save, post_delete], sender=GanjoorPoemAudio)
+def touch_catalog_on_change(sender, **kwargs):
+    """
+    Record the change, once committed, for the conditional responses and
+    cached pages of the catalog.
+    """
+    transaction.on_commit(touch_catalog)
@@ -1,39 +1,798 @@
+import csv
+import datetime
+import decimal
+import hashlib
+import json
+import os
+import uuid
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
-from .models import GanjoorPoet, GanjoorCategory, GanjoorPoem, GanjoorVerse
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+from .admin_paginator import EstimatedCountPaginator
+from .pagination import PoemCursorPagination
+from .renderers import ORJSONRenderer
+from .serializers import (
+    GanjoorCategoryListSerializer,
+    GanjoorPoemListSerializer,
+    GanjoorPoetListSerializer,
+)
+from .views import get_breadcrumbs
+from .models import (
+    CATALOG_MODIFIED_KEY,
+    GanjoorPoet,
+    GanjoorCategory,
+    GanjoorPoem,
+    GanjoorVerse,
+    GanjoorFavorite,
+    GanjoorPoemAudio,
+    GanjoorAudioSync,
+    UserSetting,
+)
 
 User = get_user_model()
 
 class GanjoorPoetModelTest(TestCase):
-    def setUp(self):
-        self.poet = GanjoorPoet.objects.create(name="Hafez")
+    @classmethod
+    def setUpTestData(cls):
+        cls.poet = GanjoorPoet.objects.create(name="Hafez")
 
     def test_str(self):
         self.assertEqual(str(self.poet), "Hafez")
 
-class GanjoorCategoryModelTest(TestCase):
+    def test_all_poets_are_cached_until_a_poet_changes(self):
+        cache.clear()
+        GanjoorPoet.objects.create(name="Attar", century="ancient")
+        self.assertEqual([poet.name for poet in GanjoorPoet.get_all_cached()], ["Attar", "Hafez"])
+        with self.assertNumQueries(0):
+            GanjoorPoet.get_all_cached()
+        self.poet.delete()
+        self.assertEqual([poet.name for poet in GanjoorPoet.get_all_cached()], ["Attar"])
+
+        response = self.client.get("/")
+        self.assertEqual(list(response.context["poets_by_century"]), ["ancient"])
+
+class GanjoorPoetAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name in ("Hafez", "Rumi", "Saadi"):
+            poet = GanjoorPoet.objects.create(name=name)
+            for title in ("Divan", "Rubaiyat"):
+                category = GanjoorCategory.objects.create(poet=poet, title=title)
+                GanjoorPoem.objects.create(category=category, title="1")
+                GanjoorPoem.objects.create(category=category, title="2")
+        cls.poet = GanjoorPoet.objects.get(name="Hafez")
+
     def setUp(self):
-        self.poet = GanjoorPoet.objects.create(name="Saadi")
-        self.category = GanjoorCategory.objects.create(poet=self.poet, title="Ghazals")
+        # Cached counts are not rolled back with the test transaction
+        cache.clear()
+
+    def test_list_counts_come_from_annotations(self):
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/poets/")
+        self.assertEqual([poet["poems_count"] for poet in response.json()["results"]], [4, 4, 4])
+
+    def test_list_answers_conditional_requests(self):
+        etag = self.client.get("/api/poets/")["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/poets/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GanjoorPoem.objects.create(category=self.poet.categories.first(), title="3")
+        response = self.client.get("/api/poets/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_categories_are_cached(self):
+        url = f"/api/poets/{self.poet.pk}/categories/"
+        self.assertEqual([category["title"] for category in self.client.get(url).json()], ["Divan", "Rubaiyat"])
+        # Only the poet lookup
+        with self.assertNumQueries(1):
+            self.assertEqual(len(self.client.get(url).json()), 2)
+
+    def test_poet_page(self):
+        # Poet, top-level categories and poems
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/poet/{self.poet.pk}/")
+        self.assertEqual([category.title for category in response.context["categories"]], ["Divan", "Rubaiyat"])
+        self.assertEqual(len(response.context["poems"]), 4)
+
+    def test_poet_poems_use_cursor_pagination(self):
+        url = f"/api/poets/{self.poet.pk}/poems/"
+        titles = []
+        with mock.patch.object(PoemCursorPagination, "page_size", 3):
+            while url:
+                data = self.client.get(url).json()
+                titles += [poem["title"] for poem in data["results"]]
+                url = data["next"]
+        self.assertEqual(titles, ["1", "1", "2", "2"])
+
+    def test_list_rows_match_serializer(self):
+        GanjoorPoet.objects.filter(pk=self.poet.pk).update(image="poets/hafez.jpg")
+        response = self.client.get("/api/poets/")
+        request = response.wsgi_request
+        poets = GanjoorPoet.objects.order_by("name")
+        expected = GanjoorPoetListSerializer(poets, many=True, context={"request": request}).data
+        self.assertEqual(response.json()["results"], json.loads(json.dumps(expected)))
+        self.assertTrue(response.json()["results"][0]["image"].startswith("http://testserver/"))
+
+    def test_poem_list_rows_match_serializer(self):
+        response = self.client.get("/api/poems/", {"ordering": "id"})
+        poems = GanjoorPoem.objects.order_by("id")[:20]
+        expected = GanjoorPoemListSerializer(poems, many=True).data
+        self.assertEqual(response.json()["results"], json.loads(json.dumps(expected)))
+
+        response = self.client.get(f"/api/poets/{self.poet.pk}/poems/")
+        poems = GanjoorPoem.objects.filter(category__poet=self.poet).order_by("title")
+        expected = GanjoorPoemListSerializer(poems, many=True).data
+        self.assertEqual(response.json()["results"], json.loads(json.dumps(expected)))
+
+    def test_detail_counts_are_cached(self):
+        with self.assertNumQueries(2):
+            data = self.client.get(f"/api/poets/{self.poet.pk}/").json()
+        self.assertEqual((data["categories_count"], data["poems_count"]), (2, 4))
+        with self.assertNumQueries(1):
+            self.client.get(f"/api/poets/{self.poet.pk}/")
+
+        # Saving a poem or category drops the cached counts
+        category = self.poet.categories.first()
+        GanjoorPoem.objects.create(category=category, title="3")
+        data = self.client.get(f"/api/poets/{self.poet.pk}/").json()
+        self.assertEqual(data["poems_count"], 5)
+        GanjoorCategory.objects.create(poet=self.poet, title="Masnavi")
+        data = self.client.get(f"/api/poets/{self.poet.pk}/").json()
+        self.assertEqual(data["categories_count"], 3)
+        category.delete()
+        data = self.client.get(f"/api/poets/{self.poet.pk}/").json()
+        self.assertEqual((data["categories_count"], data["poems_count"]), (2, 2))
+
+    def test_moves_drop_both_poets_counts(self):
+        rumi = GanjoorPoet.objects.get(name="Rumi")
+
+        def counts(poet):
+            data = self.client.get(f"/api/poets/{poet.pk}/").json()
+            return data["categories_count"], data["poems_count"]
+
+        self.assertEqual((counts(self.poet), counts(rumi)), ((2, 4), (2, 4)))
+        category = self.poet.categories.get(title="Divan")
+        category.poet = rumi
+        category.save()
+        self.assertEqual((counts(self.poet), counts(rumi)), ((1, 2), (3, 6)))
+
+        poem = GanjoorPoem.objects.filter(category=category).first()
+        poem.category = self.poet.categories.get()
+        poem.save()
+        self.assertEqual((counts(self.poet), counts(rumi)), ((1, 3), (3, 5)))
+
+class GanjoorCategoryModelTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.poet = GanjoorPoet.objects.create(name="Saadi")
+        cls.category = GanjoorCategory.objects.create(poet=cls.poet, title="Ghazals")
 
     def test_str(self):
         self.assertEqual(str(self.category), "Ghazals")
 
-class GanjoorPoemModelTest(TestCase):
+    def test_path_follows_parent(self):
+        child = GanjoorCategory.objects.create(poet=self.poet, title="Child", parent=self.category)
+        grandchild = GanjoorCategory.objects.create(poet=self.poet, title="Grandchild", parent=child)
+        self.assertEqual(grandchild.path, f"{self.category.pk}/{child.pk}/{grandchild.pk}/")
+        self.assertEqual(grandchild.ancestor_ids, [self.category.pk, child.pk])
+        with self.assertNumQueries(1):
+            self.assertEqual(grandchild.get_ancestors(), [self.category, child])
+        response = self.client.get(f"/api/categories/{grandchild.pk}/")
+        self.assertEqual(
+            [crumb["title"] for crumb in response.json()["breadcrumbs"]],
+            ["Ghazals", "Child", "Grandchild"],
+        )
+        self.assertQuerySetEqual(self.category.get_descendants(), [child, grandchild], ordered=False)
+
+        # Moving a category rewrites the paths of its whole subtree
+        child.parent = None
+        child.save()
+        grandchild.refresh_from_db()
+        self.assertEqual(grandchild.path, f"{child.pk}/{grandchild.pk}/")
+        self.assertFalse(self.category.get_descendants().exists())
+
+        GanjoorCategory.objects.update(path="")
+        self.assertEqual(GanjoorCategory.rebuild_paths(), 3)
+        grandchild.refresh_from_db()
+        self.assertEqual(grandchild.path, f"{child.pk}/{grandchild.pk}/")
+
+    def test_poem_count_follows_poems(self):
+        other = GanjoorCategory.objects.create(poet=self.poet, title="Qasidas")
+        GanjoorPoem.objects.bulk_create(
+            GanjoorPoem(category=self.category, title=f"Ghazal {n}") for n in range(3)
+        )
+        poem = GanjoorPoem.objects.filter(category=self.category).first()
+        poem.category = other
+        poem.save()
+        other.poems.all().delete()
+        # Saving the stale instance leaves the counter alone
+        self.category.save()
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.poem_count, 2)
+        other.refresh_from_db()
+        self.assertEqual(other.poem_count, 0)
+
+        GanjoorCategory.objects.update(poem_count=0)
+        GanjoorCategory.objects.refresh_poem_counts()
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.poem_count, 2)
+
+class GanjoorCategoryAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        poet = GanjoorPoet.objects.create(name="Saadi")
+        cls.root = GanjoorCategory.objects.create(poet=poet, title="Bustan")
+        child = GanjoorCategory.objects.create(poet=poet, title="Chapter 1", parent=cls.root)
+        GanjoorCategory.objects.create(poet=poet, title="Chapter 2", parent=cls.root)
+        cls.poem = GanjoorPoem.objects.create(category=cls.root, title="Preface")
+        GanjoorPoem.objects.create(category=child, title="Story 1")
+        GanjoorPoem.objects.create(category=child, title="Story 2")
+
     def setUp(self):
-        self.poet = GanjoorPoet.objects.create(name="Rumi")
-        self.category = GanjoorCategory.objects.create(poet=self.poet, title="Masnavi")
-        self.poem = GanjoorPoem.objects.create(category=self.category, title="First Poem", url="poem-1")
+        # Cached pages are not rolled back with the test transaction
+        cache.clear()
+
+    def test_poems_count_includes_subcategories(self):
+        with self.assertNumQueries(2):
+            results = self.client.get("/api/categories/").json()["results"]
+        counts = {category["title"]: category["poems_count"] for category in results}
+        self.assertEqual(counts, {"Bustan": 3, "Chapter 1": 2, "Chapter 2": 0})
+
+        data = self.client.get(f"/api/categories/{self.root.pk}/").json()
+        self.assertEqual(data["poems_count"], 3)
+        self.assertEqual(sorted(child["poems_count"] for child in data["children"]), [0, 2])
+
+    def test_list_rows_match_serializer(self):
+        results = self.client.get("/api/categories/").json()["results"]
+        categories = GanjoorCategory.objects.with_poems_count().order_by("title")
+        expected = GanjoorCategoryListSerializer(categories, many=True).data
+        self.assertEqual(results, json.loads(json.dumps(expected)))
+
+    def test_category_page_lists_all_poems(self):
+        response = self.client.get(f"/category/{self.root.pk}/")
+        self.assertEqual(
+            [poem.title for poem in response.context["all_poems"]],
+            ["Preface", "Story 1", "Story 2"],
+        )
+
+    def test_poem_page_splits_hemistichs(self):
+        GanjoorVerse.objects.bulk_create(
+            GanjoorVerse(poem=self.poem, order=order, position=position, text=text)
+            for order, position, text in [(2, 1, "left"), (1, 0, "right"), (3, 5, "comment")]
+        )
+        context = self.client.get(f"/poem/{self.poem.pk}/").context
+        self.assertEqual(
+            list(context["couplets"]),
+            [{"order": 1, "right": "right", "left": ""}, {"order": 2, "right": "", "left": "left"}],
+        )
+        self.assertEqual([verse.text for verse in context["single_verses"]], ["comment"])
+
+    def test_poem_page_skips_search_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(f"/poem/{self.poem.pk}/")
+        self.assertFalse(any("search_corpus" in q["sql"] for q in ctx.captured_queries))
+
+    def test_breadcrumbs_use_one_query(self):
+        grandchild = GanjoorCategory.objects.create(
+            poet=self.root.poet, title="Section", parent=self.root.children.get(title="Chapter 1")
+        )
+        with self.assertNumQueries(1):
+            crumbs = get_breadcrumbs(grandchild)
+        self.assertEqual([crumb.title for crumb in crumbs], ["Bustan", "Chapter 1", "Section"])
+
+    def test_pages_are_cached_until_the_catalog_changes(self):
+        url = f"/category/{self.root.pk}/"
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            GanjoorPoem.objects.create(category=self.root, title="Epilogue")
+        self.assertContains(self.client.get(url), "Epilogue")
+
+    def test_poem_detail_lists_uploaded_audios(self):
+        for uploaded in (True, False):
+            GanjoorPoemAudio.objects.create(
+                poem=self.poem, sync_guid=uuid.uuid4(), is_uploaded=uploaded
+            )
+        data = self.client.get(f"/api/poems/{self.poem.pk}/").json()
+        self.assertEqual(len(data["audios"]), 1)
+        self.assertEqual(data["verses_count"], 0)
+
+    def test_audio_sync_list_annotates_verse_text(self):
+        GanjoorVerse.objects.create(poem=self.poem, order=1, text="first")
+        audio = GanjoorPoemAudio.objects.create(poem=self.poem, sync_guid=uuid.uuid4())
+        GanjoorAudioSync.bulk_import(audio, [(1, 0), (2, 1500)])
+        with self.assertNumQueries(2):
+            results = self.client.get("/api/audio-syncs/").json()["results"]
+        self.assertEqual([sync["verse_text"] for sync in results], ["first", None])
+
+    def test_poem_detail_prefetches_verses(self):
+        GanjoorVerse.objects.bulk_create(
+            GanjoorVerse(poem=self.poem, order=order, text=f"verse {order}")
+            for order in (2, 1, 3)
+        )
+        # Poem, verses and audios
+        with self.assertNumQueries(3):
+            data = self.client.get(f"/api/poems/{self.poem.pk}/").json()
+        self.assertEqual([verse["order"] for verse in data["verses"]], [1, 2, 3])
+
+    def test_poem_detail_field_selection(self):
+        GanjoorVerse.objects.create(poem=self.poem, order=1, text="verse")
+        url = f"/api/poems/{self.poem.pk}/"
+        with self.assertNumQueries(1):
+            data = self.client.get(url, {"fields": "id,title"}).json()
+        self.assertEqual(data, {"id": self.poem.pk, "title": "Preface"})
+        with self.assertNumQueries(2):
+            data = self.client.get(url, {"omit": "audios"}).json()
+        self.assertNotIn("audios", data)
+        self.assertEqual(len(data["verses"]), 1)
+
+class GanjoorPoemModelTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.poet = GanjoorPoet.objects.create(name="Rumi")
+        cls.category = GanjoorCategory.objects.create(poet=cls.poet, title="Masnavi")
+        cls.poem = GanjoorPoem.objects.create(category=cls.category, title="First Poem", url="poem-1")
 
     def test_str(self):
         self.assertEqual(str(self.poem), "First Poem")
 
+    def test_verse_count_follows_verses(self):
+        other = GanjoorPoem.objects.create(category=self.category, title="Other")
+        GanjoorVerse.objects.bulk_create(
+            GanjoorVerse(poem=self.poem, order=order, text="verse")
+            for order in range(1, 4)
+        )
+        self.poem.refresh_from_db()
+        self.assertEqual(self.poem.verse_count, 3)
+
+        GanjoorVerse.objects.filter(order=3).update(poem=other)
+        GanjoorVerse.objects.filter(order=1).delete()
+        self.poem.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.poem.verse_count, other.verse_count), (1, 1))
+
+    def test_search_matches_title_or_verses_once(self):
+        GanjoorVerse.objects.create(poem=self.poem, order=1, text="night and day")
+        GanjoorVerse.objects.create(poem=self.poem, order=2, text="day and night")
+        self.assertEqual(list(GanjoorPoem.objects.search("night")), [self.poem])
+        self.assertEqual(list(GanjoorPoem.objects.search("first")), [self.poem])
+        self.assertFalse(GanjoorPoem.objects.search("night", poet_id=self.poet.pk + 1).exists())
+        # Verses are kept apart in the search corpus
+        self.assertFalse(GanjoorPoem.objects.search("day day").exists())
+
+        # The API search filter reads the corpus too, without joining verses
+        with CaptureQueriesContext(connection) as queries:
+            results = self.client.get("/api/poems/", {"search": "night"}).json()["results"]
+        self.assertEqual([poem["id"] for poem in results], [self.poem.pk])
+        self.assertFalse(any("ganjoor_verse" in query["sql"] for query in queries))
+
+    def test_with_first_verses(self):
+        GanjoorVerse.objects.bulk_create(
+            GanjoorVerse(poem=self.poem, order=order, text=f"verse {order}")
+            for order in range(1, 6)
+        )
+        with self.assertNumQueries(2):
+            poem = GanjoorPoem.objects.with_first_verses(3).get(pk=self.poem.pk)
+            self.assertEqual([verse.order for verse in poem.head_verses], [1, 2, 3])
+
+    def test_search_loads_listing_columns_only(self):
+        poem = GanjoorPoem.objects.search("first").get()
+        self.assertEqual(poem.get_deferred_fields(), {"search_corpus", "search_vec"})
+        with self.assertNumQueries(0):
+            self.assertEqual((poem.category.title, poem.category.poet.name), ("Masnavi", "Rumi"))
+
+    def test_search_ranks_best_matches_first(self):
+        other = GanjoorPoem.objects.create(category=self.category, title="Another")
+        GanjoorVerse.objects.bulk_create(
+            [
+                GanjoorVerse(poem=self.poem, order=1, text="rose and wine"),
+                GanjoorVerse(poem=other, order=1, text="rose rose rose"),
+            ]
+        )
+        self.assertEqual(list(GanjoorPoem.objects.search("rose")), [other, self.poem])
+        response = self.client.get("/api/poems/search/", {"q": "rose"})
+        self.assertEqual([poem["id"] for poem in response.json()["results"]], [other.pk, self.poem.pk])
+
+    def test_word_search_uses_search_vector(self):
+        verse = GanjoorVerse.objects.create(poem=self.poem, order=1, text="nightingale song")
+        self.assertEqual(list(GanjoorPoem.objects.search("nightingale")), [self.poem])
+        # Single words match whole words only; phrases fall back to substrings
+        self.assertFalse(GanjoorPoem.objects.search("night").exists())
+        self.assertEqual(list(GanjoorPoem.objects.search("ngale so")), [self.poem])
+
+        verse.delete()
+        self.assertFalse(GanjoorPoem.objects.search("nightingale").exists())
+        self.poem.title = "Renamed"
+        self.poem.save()
+        self.assertTrue(GanjoorPoem.objects.search("renamed").exists())
+
+    def test_audio_identifiers_are_binary(self):
+        digest = hashlib.sha256(b"audio").digest()
+        audio = GanjoorPoemAudio.objects.create(
+            poem=self.poem,
+            download_url="https://example.com/a.mp3",
+            sync_guid=uuid.uuid4(),
+            file_checksum=digest,
+            is_uploaded=True,
+        )
+        audio.refresh_from_db()
+        self.assertEqual(bytes(audio.file_checksum), digest)
+        data = self.client.get(f"/api/audios/{audio.pk}/").json()
+        self.assertEqual(data["file_checksum"], digest.hex())
+        self.assertEqual(data["sync_guid"], str(audio.sync_guid))
+
+    def test_verse_and_audio_lists_do_not_query_per_row(self):
+        GanjoorVerse.objects.bulk_create(GanjoorVerse(poem=self.poem, order=order, text="verse") for order in range(3))
+        for _ in range(3):
+            GanjoorPoemAudio.objects.create(poem=self.poem, sync_guid=uuid.uuid4())
+        # Count and page
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.client.get("/api/verses/").json()["results"]), 3)
+        with self.assertNumQueries(2):
+            results = self.client.get("/api/audios/").json()["results"]
+        self.assertEqual({audio["poem_title"] for audio in results}, {self.poem.title})
+
+    def test_audio_file_urls_are_absolute(self):
+        for name in ("a.mp3", "b.mp3"):
+            GanjoorPoemAudio.objects.create(poem=self.poem, file=f"audios/{name}", sync_guid=uuid.uuid4())
+        results = self.client.get("/api/audios/").json()["results"]
+        self.assertEqual(
+            [audio["file_url"] for audio in results],
+            [f"http://testserver{settings.MEDIA_URL}audios/{name}" for name in ("a.mp3", "b.mp3")],
+        )
+
 class GanjoorVerseModelTest(TestCase):
-    def setUp(self):
-        self.poet = GanjoorPoet.objects.create(name="Attar")
-        self.category = GanjoorCategory.objects.create(poet=self.poet, title="Divan")
-        self.poem = GanjoorPoem.objects.create(category=self.category, title="Divan Poem", url="divan-poem")
-        self.verse = GanjoorVerse.objects.create(poem=self.poem, order=1, position=1, text="Some verse text")
+    @classmethod
+    def setUpTestData(cls):
+        cls.poet = GanjoorPoet.objects.create(name="Attar")
+        cls.category = GanjoorCategory.objects.create(poet=cls.poet, title="Divan")
+        cls.poem = GanjoorPoem.objects.create(category=cls.category, title="Divan Poem", url="divan-poem")
+        cls.verse = GanjoorVerse.objects.create(poem=cls.poem, order=1, position=1, text="Some verse text")
 
     def test_str(self):
-        self.assertIn("Divan Poem", str(self.verse))
\ No newline at end of file
+        self.assertIn("Divan Poem", str(self.verse))
+
+    def test_bulk_import(self):
+        count = GanjoorVerse.bulk_import(
+            self.poem, [(0, "one"), (1, "two"), (0, "three")], batch_size=2
+        )
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            list(self.poem.verses.values_list("order", "text")),
+            [(1, "Some verse text"), (2, "two"), (3, "three")],
+        )
+
+    def test_bulk_import_touches_catalog(self):
+        cache.delete(CATALOG_MODIFIED_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            GanjoorVerse.bulk_import(self.poem, [(0, "one")])
+        self.assertIsNotNone(cache.get(CATALOG_MODIFIED_KEY))
+
+    def test_str_does_not_query_poem(self):
+        verse = GanjoorVerse.objects.get(pk=self.verse.pk)
+        with self.assertNumQueries(0):
+            self.assertIn(f"#{self.poem.pk} [1]", str(verse))
+
+    def test_text_preview_is_generated(self):
+        verse = GanjoorVerse.objects.defer("text").get(pk=self.verse.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(verse), f"#{self.poem.pk} [1] Some verse text...")
+        GanjoorVerse.objects.filter(pk=verse.pk).update(text="x" * 30)
+        verse.refresh_from_db()
+        self.assertEqual(verse.text_preview, "x" * 20)
+
+    def test_api_bulk_create(self):
+        self.client.force_login(User.objects.create_user("editor", password="pass"))
+        verses = [
+            {"poem": self.poem.pk, "order": order, "position": 0, "text": f"verse {order}"}
+            for order in (2, 3, 1, 3)
+        ]
+        response = self.client.post("/api/verses/", verses, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([bool(errors) for errors in response.json()["errors"]], [False, False, True, True])
+
+        response = self.client.post("/api/verses/", verses[:2], content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([verse["order"] for verse in response.json()], [2, 3])
+        self.assertTrue(all(verse["id"] for verse in response.json()))
+        self.poem.refresh_from_db()
+        self.assertEqual(self.poem.verse_count, 3)
+
+class GanjoorFavoriteTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("reader", password="pass")
+        poet = GanjoorPoet.objects.create(name="Hafez")
+        category = GanjoorCategory.objects.create(poet=poet, title="Ghazals")
+        cls.poem = GanjoorPoem.objects.create(category=category, title="Ghazal 1")
+        cls.verse = GanjoorVerse.objects.create(poem=cls.poem, order=1, text="verse")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_verse_can_be_added_once(self):
+        data = {"poem": self.poem.pk, "verse": self.verse.pk}
+        response = self.client.post("/api/favorites/", data, content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        response = self.client.post("/api/favorites/", data, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"]["non_field_errors"],
+            ["This verse has already been added to favorites."],
+        )
+        self.assertEqual(GanjoorFavorite.objects.filter(user=self.user).count(), 1)
+
+    def test_toggle(self):
+        data = {"poem": self.poem.pk, "verse": self.verse.pk}
+        response = self.client.post("/api/favorites/toggle/", data, content_type="application/json")
+        self.assertEqual((response.status_code, response.json()["status"]), (201, "added"))
+        # Session and user lookups, then the DELETE
+        with self.assertNumQueries(3):
+            response = self.client.post("/api/favorites/toggle/", data, content_type="application/json")
+        self.assertEqual((response.status_code, response.json()["status"]), (200, "removed"))
+        self.assertFalse(GanjoorFavorite.objects.exists())
+
+    def test_many_verses_can_be_added_at_once(self):
+        GanjoorFavorite.objects.create(user=self.user, poem=self.poem, verse=self.verse)
+        verses = [GanjoorVerse.objects.create(poem=self.poem, order=order, text="verse") for order in (2, 3)]
+        data = [{"poem": self.poem.pk, "verse": verse.pk} for verse in [*verses, self.verse]]
+        response = self.client.post("/api/favorites/", data, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([bool(errors) for errors in response.json()["errors"]], [False, False, True])
+
+        response = self.client.post("/api/favorites/", data[:2], content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual({fav["user"] for fav in response.json()}, {self.user.pk})
+        self.assertEqual(GanjoorFavorite.objects.filter(user=self.user).count(), 3)
+
+    def test_duplicate_verse_order_is_rejected(self):
+        data = {"poem": self.poem.pk, "order": 1, "text": "duplicate"}
+        response = self.client.post("/api/verses/", data, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("non_field_errors", response.json()["errors"])
+        self.assertEqual(GanjoorVerse.objects.filter(poem=self.poem).count(), 1)
+
+    def test_list_joins_nested_fields(self):
+        GanjoorFavorite.objects.create(user=self.user, poem=self.poem, verse=self.verse)
+        verse = GanjoorVerse.objects.create(poem=self.poem, order=2, text="another")
+        GanjoorFavorite.objects.create(user=self.user, poem=self.poem, verse=verse)
+        # Session and user lookups, then count and page
+        with self.assertNumQueries(4):
+            results = self.client.get("/api/favorites/").json()["results"]
+        self.assertEqual({fav["user_username"] for fav in results}, {"reader"})
+        self.assertEqual({fav["poet_name"] for fav in results}, {"Hafez"})
+        self.assertEqual({fav["verse_text"] for fav in results}, {self.verse.text, "another"})
+
+    def test_favorites_page_lists_poems(self):
+        GanjoorFavorite.objects.create(user=self.user, poem=self.poem, verse=self.verse)
+        response = self.client.get("/favorites/")
+        self.assertContains(response, "Ghazal 1")
+
+        self.client.logout()
+        self.assertEqual(self.client.get("/favorites/").status_code, 302)
+
+class ImportGanjoorCommandTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_csv(self, name, header, rows):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        return path
+
+    def run_import(self, **options):
+        poets = self.write_csv(
+            "poets.csv",
+            ["Id", "Name", "Description", "Century"],
+            [[1, "Hafez", "", "classical"], [2, "Saadi", "", "classical"]],
+        )
+        cats = self.write_csv(
+            "cats.csv",
+            ["Id", "PoetId", "ParentId", "Title", "Url"],
+            [
+                [10, 1, 0, "Divan", "/hafez"],
+                [11, 1, 10, "Ghazals", "/hafez/ghazal"],
+                [12, 99, 0, "Orphan", ""],
+            ],
+        )
+        poems = self.write_csv(
+            "poems.csv",
+            ["Id", "CatId", "Title", "Url"],
+            [[100, 11, "Ghazal 1", "/hafez/ghazal/sh1"], [101, 12, "Lost", ""]],
+        )
+        verses = self.write_csv(
+            "verses.csv",
+            ["Id", "PoemId", "VOrder", "Position", "Text"],
+            [
+                [1000, 100, 1, 0, "first"],
+                [1001, 100, 2, 1, "second"],
+                [1002, 101, 1, 0, "orphan"],
+            ],
+        )
+        out = StringIO()
+        call_command(
+            "import_ganjoor",
+            poets=poets,
+            cats=cats,
+            poems=poems,
+            verses=verses,
+            stdout=out,
+            **options,
+        )
+        return out.getvalue()
+
+    def test_import(self):
+        self.run_import()
+        self.assertEqual(GanjoorPoet.objects.count(), 2)
+        self.assertEqual(GanjoorCategory.objects.count(), 2)
+        self.assertEqual(GanjoorCategory.objects.get(id=11).parent_id, 10)
+        self.assertEqual(GanjoorCategory.objects.get(id=11).path, "10/11/")
+        self.assertEqual(GanjoorPoem.objects.count(), 1)
+        self.assertEqual(GanjoorVerse.objects.filter(poem_id=100).count(), 2)
+        self.assertEqual(GanjoorPoem.objects.get(id=100).verse_count, 2)
+        self.assertFalse(GanjoorVerse.objects.filter(id=1002).exists())
+
+    def test_reimport_skips_existing_rows(self):
+        self.run_import()
+        output = self.run_import()
+        self.assertIn("Imported 0 poets (2 skipped)", output)
+        self.assertIn("Imported 0 verses (3 skipped)", output)
+        self.assertIn("0 parent relationships set", output)
+        self.assertEqual(GanjoorPoet.objects.count(), 2)
+        self.assertEqual(GanjoorVerse.objects.count(), 2)
+
+    def test_import_with_triggers_disabled(self):
+        self.run_import(disable_triggers=True)
+        self.assertEqual(GanjoorVerse.objects.count(), 2)
+        self.assertEqual(GanjoorPoem.objects.get(id=100).verse_count, 2)
+        self.assertEqual(GanjoorCategory.objects.get(id=11).path, "10/11/")
+        self.assertEqual(GanjoorCategory.objects.get(id=11).poem_count, 1)
+        self.assertTrue(GanjoorPoem.objects.search("second").filter(id=100).exists())
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW session_replication_role")
+            self.assertEqual(cursor.fetchone()[0], "origin")
+
+    def test_rebuild_indexes_restores_indexes(self):
+        table = GanjoorVerse._meta.db_table
+        with connection.cursor() as cursor:
+            before = connection.introspection.get_constraints(cursor, table)
+        self.run_import(rebuild_indexes=True)
+        with connection.cursor() as cursor:
+            after = connection.introspection.get_constraints(cursor, table)
+        self.assertEqual(sorted(before), sorted(after))
+        self.assertEqual(GanjoorVerse.objects.count(), 2)
+
+class CustomExceptionHandlerTest(TestCase):
+    def test_not_found_response(self):
+        response = self.client.get("/api/poets/999999/")
+        self.assertEqual(response.status_code, 404)
+        data = response.json()
+        self.assertEqual(data["error"], "error")
+        self.assertEqual(data["detail"], "No GanjoorPoet matches the given query.")
+        self.assertNotIn("_debug", data)
+
+    def test_staff_gets_debug_info(self):
+        staff = User.objects.create_user("admin", password="pass", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get("/api/poets/999999/")
+        self.assertEqual(response.json()["_debug"]["view"], "GanjoorPoetViewSet")
+
+class ORJSONRendererTest(TestCase):
+    def test_output_matches_json_renderer(self):
+        data = {
+            "text": "غزل\u2028",
+            "lazy": _("Poet"),
+            1: decimal.Decimal("1.5"),
+            "when": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            "guid": uuid.UUID(int=1),
+            "items": [None, True, 2.5],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_api_uses_orjson_renderer(self):
+        response = self.client.get("/api/poets/")
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+
+class SchemaViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_schema_is_cached(self):
+        from drf_spectacular.generators import SchemaGenerator
+
+        get_schema = SchemaGenerator.get_schema
+        with mock.patch.object(
+            SchemaGenerator, "get_schema", autospec=True, side_effect=get_schema
+        ) as generate:
+            first = self.client.get("/api/schema/")
+            second = self.client.get("/api/schema/")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(generate.call_count, 1)
+
+class EstimatedCountPaginatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        poet = GanjoorPoet.objects.create(name="Hafez")
+        category = GanjoorCategory.objects.create(poet=poet, title="Ghazals")
+        poem = GanjoorPoem.objects.create(category=category, title="Ghazal 1")
+        for order in range(1, 4):
+            GanjoorVerse.objects.create(poem=poem, order=order, text="verse")
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {GanjoorVerse._meta.db_table}")
+
+    def test_unfiltered_count_uses_estimate(self):
+        paginator = EstimatedCountPaginator(GanjoorVerse.objects.all(), 10)
+        paginator.exact_count_threshold = 0
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(paginator.count, 3)
+        self.assertIn("reltuples", ctx.captured_queries[0]["sql"])
+
+    def test_filtered_count_is_exact(self):
+        paginator = EstimatedCountPaginator(GanjoorVerse.objects.filter(order=1), 10)
+        paginator.exact_count_threshold = 0
+        self.assertEqual(paginator.count, 1)
+
+class UserSettingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("reader", password="pass")
+
+    def setUp(self):
+        # Cached settings are not rolled back with the test transaction
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def test_get_for_user_is_cached_until_saved(self):
+        UserSetting.objects.create(user=self.user, font_size=18)
+        self.assertEqual(UserSetting.get_for_user(self.user).font_size, 18)
+        with self.assertNumQueries(0):
+            setting = UserSetting.get_for_user(self.user)
+
+        setting.font_size = 20
+        setting.save()
+        self.assertEqual(UserSetting.get_for_user(self.user).font_size, 20)
+
+        setting.delete()
+        with self.assertRaises(UserSetting.DoesNotExist):
+            UserSetting.get_for_user(self.user)
+
+    def test_flags_round_trip_through_api(self):
+        response = self.client.post(
+            "/api/settings/me/",
+            {"copy_button_visible": False, "print_button_visible": False},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(response.json()["copy_button_visible"])
+        self.assertTrue(response.json()["browse_button_visible"])
+
+        setting = UserSetting.objects.get(user=self.user)
+        self.assertEqual(setting.button_flags, 0xFF & ~(1 << 2) & ~(1 << 3))
+
+        self.client.post(
+            "/api/settings/me/",
+            {"copy_button_visible": True},
+            content_type="application/json",
+        )
+        setting.refresh_from_db()
+        self.assertTrue(setting.copy_button_visible)
+        self.assertFalse(setting.print_button_visible)
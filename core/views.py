@@ -6,16 +6,35 @@ and DRF ViewSets for the REST API.
 """
 
 import logging
+from functools import wraps
+from asgiref.sync import sync_to_async
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404, render
-from django.db.models import Q, Prefetch, Count
+from django.db.models import (
+    Case,
+    F,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Sum,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.db import IntegrityError, transaction
 from django.core.cache import cache
+from django.utils.decorators import method_decorator
+from django.utils.functional import SimpleLazyObject
 from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import get_language
 from rest_framework import permissions, viewsets, filters, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .models import (
@@ -28,7 +47,9 @@ from .models import (
     GanjoorVerse,
     UserSetting,
     VersePosition,
+    catalog_last_modified,
 )
+from .pagination import PoemCursorPagination
 from .serializers import (
     GanjoorAudioSyncSerializer,
     GanjoorCategorySerializer,
@@ -41,54 +62,97 @@ from .serializers import (
     GanjoorPoetListSerializer,
     GanjoorVerseSerializer,
     UserSettingSerializer,
+    POEM_LIST_COLUMNS,
+    absolute_url,
+    is_field_requested,
+    serialize_poem_row,
 )
 
 logger = logging.getLogger(__name__)
 
+# Century labels in display order; the labels are lazy and follow the
+# active language
+CENTURY_DISPLAY = dict(GanjoorPoet.CENTURY_CHOICES)
+
 
 # -------------------
 # Helper Functions
 # -------------------
+def save_unique(serializer, **kwargs):
+    """
+    Save a serializer whose model has a unique constraint, leaving the
+    duplicate check to the database.
+
+    A violation is reported as a validation error with the serializer's
+    ``duplicate_message``, in the same shape as errors raised by validate().
+
+    Args:
+        serializer: Validated serializer instance
+        **kwargs: Extra attributes passed to serializer.save()
+
+    Returns:
+        The saved instance
+    """
+    try:
+        # Savepoint, so the request transaction stays usable on failure
+        with transaction.atomic():
+            return serializer.save(**kwargs)
+    except IntegrityError:
+        raise ValidationError(
+            {api_settings.NON_FIELD_ERRORS_KEY: [serializer.duplicate_message]}
+        )
+
+
+def cache_catalog_page(timeout):
+    """
+    Like cache_page(), but keyed on catalog_last_modified(), so cached pages
+    are retired as soon as a poet, category, poem, verse or audio changes.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            key_prefix = f"catalog:{catalog_last_modified().timestamp()}"
+            cached_view = cache_page(timeout, key_prefix=key_prefix)(view_func)
+            return cached_view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def get_breadcrumbs(category):
     """
     Return breadcrumbs safely even if parent category was deleted.
 
+    The ancestors are read from the materialized category path with one
+    query.
+
     Args:
         category: GanjoorCategory instance
 
     Returns:
         List of category objects representing the breadcrumb trail
     """
-    crumbs = []
-    current = category
-    max_depth = 10  # Prevent infinite loops
-    depth = 0
-
-    while current and depth < max_depth:
-        crumbs.insert(0, current)
-        try:
-            current = current.parent
-        except GanjoorCategory.DoesNotExist:
-            break
-        depth += 1
-
-    return crumbs
+    return [*category.get_ancestors(), category]
 
 
 def get_all_poems(category):
     """
-    Recursively collect all poems in category and subcategories.
+    Collect all poems in category and subcategories with one query, found
+    through the materialized category path.
 
     Args:
         category: GanjoorCategory instance
 
     Returns:
-        List of GanjoorPoem objects
+        List of GanjoorPoem objects, grouped by category
     """
-    poems = list(category.poems.select_related("category__poet").all())
-    for subcat in category.children.all():
-        poems += get_all_poems(subcat)
-    return poems
+    return list(
+        GanjoorPoem.objects.filter(category__path__startswith=category.path)
+        .only("id", "title")
+        .order_by("category__path", "title")
+    )
 
 
 # -------------------
@@ -105,16 +169,22 @@ def home(request):
     Returns:
         Rendered home page
     """
-    poets_by_century = {}
+    # Bucket the poets (ordered by name) by century in one pass
+    buckets = {century: [] for century in CENTURY_DISPLAY}
+    for poet in GanjoorPoet.get_all_cached():
+        if poet.century in buckets:
+            buckets[poet.century].append(poet)
 
-    for century, century_display in GanjoorPoet.CENTURY_CHOICES:
-        poets = GanjoorPoet.objects.filter(century=century).order_by("name")
-        if poets.exists():
-            poets_by_century[century] = {"display": century_display, "poets": poets}
+    poets_by_century = {
+        century: {"display": CENTURY_DISPLAY[century], "poets": poets}
+        for century, poets in buckets.items()
+        if poets
+    }
 
     return render(request, "core/home.html", {"poets_by_century": poets_by_century})
 
 
+@cache_catalog_page(60 * 60)
 def poet_detail(request, pk):
     """
     Display poet detail page with categories and poems.
@@ -129,18 +199,17 @@ def poet_detail(request, pk):
     # Use select_related and prefetch_related for optimization
     poet = get_object_or_404(GanjoorPoet, pk=pk)
 
-    # Get top-level categories with poem counts
+    # Get top-level categories; the page only links to them by title
     categories = (
         poet.categories.filter(parent=None)
-        .prefetch_related("children")
-        .annotate(poems_count=Count("poems"))
+        .only("id", "poet_id", "title")
         .order_by("title")
     )
 
     # Get all poems for this poet
     poems = (
-        GanjoorPoem.objects.select_related("category__poet")
-        .filter(category__poet=poet)
+        GanjoorPoem.objects.filter(category__poet=poet)
+        .only("id", "title")
         .order_by("title")[:50]  # Limit initial display
     )
 
@@ -153,6 +222,7 @@ def poet_detail(request, pk):
     return render(request, "core/poet_detail.html", context)
 
 
+@cache_catalog_page(60 * 60)
 def category_detail(request, pk):
     """
     Display category detail page with poems and subcategories.
@@ -169,14 +239,16 @@ def category_detail(request, pk):
         GanjoorCategory.objects.select_related("poet", "parent"), pk=pk
     )
 
-    # Get poems in this category
-    poems = category.poems.select_related("category__poet").order_by("title")
-
-    # Get subcategories with poem counts
-    subcategories = category.children.annotate(poems_count=Count("poems")).order_by(
-        "title"
+    # Get poems in this category, without their search columns
+    poems = (
+        category.poems.select_related("category__poet")
+        .defer("search_corpus", "search_vec")
+        .order_by("title")
     )
 
+    # Get subcategories; their poem counts are stored in poem_count
+    subcategories = category.children.order_by("title")
+
     breadcrumbs = get_breadcrumbs(category)
     all_poems = get_all_poems(category)
 
@@ -191,6 +263,7 @@ def category_detail(request, pk):
     return render(request, "core/category_detail.html", context)
 
 
+@cache_catalog_page(60 * 60)
 def poem_detail(request, pk):
     """
     Display poem detail page with verses.
@@ -202,26 +275,41 @@ def poem_detail(request, pk):
     Returns:
         Rendered poem detail page
     """
-    # Fetch poem with category & poet to prevent N+1
+    # Fetch poem with category & poet to prevent N+1; the verses are shown
+    # from their own rows, so the search columns are not loaded
     poem = get_object_or_404(
-        GanjoorPoem.objects.select_related("category__poet"), pk=pk
+        GanjoorPoem.objects.select_related("category__poet").defer(
+            "search_corpus", "search_vec"
+        ),
+        pk=pk,
     )
 
-    # Group verses by order and position
-    verses_qs = poem.verses.all().order_by("order", "position")
-    verses_map = {}  # classic two-hemistich
-    single_verses = []  # free, centered, comments, paragraphs
-
-    for v in verses_qs:
-        if v.position in (VersePosition.RIGHT, VersePosition.LEFT):
-            if v.order not in verses_map:
-                verses_map[v.order] = ["", ""]
-            if v.position == VersePosition.RIGHT:
-                verses_map[v.order][0] = v.text
-            else:
-                verses_map[v.order][1] = v.text
-        else:
-            single_verses.append(v)
+    # Classic two-hemistich verses, with the text placed in the right or
+    # left column by the database
+    hemistichs = (VersePosition.RIGHT, VersePosition.LEFT)
+    couplets = (
+        poem.verses.filter(position__in=hemistichs)
+        .values("order")
+        .annotate(
+            right=Case(
+                When(position=VersePosition.RIGHT, then="text"),
+                default=Value(""),
+                output_field=TextField(),
+            ),
+            left=Case(
+                When(position=VersePosition.LEFT, then="text"),
+                default=Value(""),
+                output_field=TextField(),
+            ),
+        )
+        .order_by("order")
+    )
+    # Free, centered, comments, paragraphs
+    single_verses = (
+        poem.verses.exclude(position__in=hemistichs)
+        .only("text")
+        .order_by("order", "position")
+    )
 
     breadcrumbs = get_breadcrumbs(poem.category)
 
@@ -230,7 +318,7 @@ def poem_detail(request, pk):
 
     context = {
         "poem": poem,
-        "verses_map": verses_map,
+        "couplets": couplets,
         "single_verses": single_verses,
         "breadcrumbs": breadcrumbs,
         "audios": audios,
@@ -240,23 +328,37 @@ def poem_detail(request, pk):
 
 
 @login_required
-def favorites(request):
+async def favorites(request):
     """
     Display user's favorite poems and verses.
 
+    The favorites are read with the async ORM, so under ASGI the event loop
+    serves other requests while waiting on the database.
+
     Args:
         request: HTTP request object
 
     Returns:
         Rendered favorites page
     """
-    favs = request.user.ganjoor_favorites.select_related(
-        "poem__category__poet", "verse"
-    ).order_by("-created_at")
+    user = await request.auser()
+    # The page only shows the poem of each favorite
+    favs = [
+        fav
+        async for fav in GanjoorFavorite.objects.filter(user=user)
+        .select_related("poem")
+        .only("id", "poem__title")
+        .order_by("-created_at")
+        .aiterator(chunk_size=200)
+    ]
 
-    return render(request, "core/favorites.html", {"favorites": favs})
+    # Context processors may still touch the database (request.user)
+    return await sync_to_async(render)(
+        request, "core/favorites.html", {"favorites": favs}
+    )
 
 
+@cache_catalog_page(60 * 60)
 def search(request):
     """
     Search for poems by title or verse content.
@@ -273,23 +375,17 @@ def search(request):
     poems = GanjoorPoem.objects.none()
 
     if query:
-        # Use select_related to avoid N+1 queries
-        poems_qs = GanjoorPoem.objects.select_related("category__poet")
-
         # Filter by poet if specified
-        if poet_id:
-            try:
-                poems_qs = poems_qs.filter(category__poet_id=int(poet_id))
-            except (ValueError, TypeError):
-                pass
+        try:
+            poet_filter = int(poet_id) if poet_id else None
+        except (ValueError, TypeError):
+            poet_filter = None
 
-        # Search in title and verse text
-        poems = poems_qs.filter(
-            Q(title__icontains=query) | Q(verses__text__icontains=query)
-        ).distinct()[:100]  # Limit results
+        # Search in title and verse text, best matches first
+        poems = GanjoorPoem.objects.search(query, poet_filter)[:100]
 
-    # Get all poets for filter dropdown
-    poets = GanjoorPoet.objects.all().order_by("name")
+    # Get all poets for filter dropdown, read from the cache when rendered
+    poets = SimpleLazyObject(GanjoorPoet.get_all_cached)
 
     context = {
         "poems": poems,
@@ -304,7 +400,77 @@ def search(request):
 # -------------------
 # DRF ViewSets
 # -------------------
-class GanjoorPoetViewSet(viewsets.ModelViewSet):
+def catalog_etag(request, *args, **kwargs):
+    return catalog_last_modified().isoformat()
+
+
+def catalog_modified(request, *args, **kwargs):
+    return catalog_last_modified()
+
+
+# Answers conditional GETs of lists that only change with poets, categories
+# or poems with 304 Not Modified, before any query or serialization
+catalog_condition = method_decorator(
+    condition(etag_func=catalog_etag, last_modified_func=catalog_modified)
+)
+
+
+def poem_list_response(view, queryset):
+    """
+    Return the (paginated) GanjoorPoemListSerializer response for a poem
+    queryset, built from values_list() rows by serialize_poem_row().
+    """
+    rows = queryset.values_list(*POEM_LIST_COLUMNS)
+    page = view.paginate_queryset(rows)
+    if page is not None:
+        return view.get_paginated_response([serialize_poem_row(row) for row in page])
+    return Response([serialize_poem_row(row) for row in rows])
+
+
+class BulkCreateMixin:
+    """
+    Let the create action also accept a list of objects, saved in one batch
+    by the ``list_serializer_class`` of the serializer.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class ValuesListMixin:
+    """
+    Serve the list action from ``values()`` rows instead of model instances.
+
+    Building model instances and running them through a ModelSerializer
+    dominates the cost of large read-only lists. Subclasses name the
+    response keys in ``list_values`` (model fields) and
+    ``list_expressions`` (key -> expression); ``list_rows`` can post-process
+    the rows of a page. The output must match the action's serializer,
+    which still documents the response schema.
+    """
+
+    list_values = ()
+    list_expressions = {}
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *self.list_values, **self.list_expressions
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.list_rows(page))
+        return Response(self.list_rows(list(queryset)))
+
+    def list_rows(self, rows):
+        return rows
+
+
+class GanjoorPoetViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing poets.
 
@@ -322,6 +488,24 @@ class GanjoorPoetViewSet(viewsets.ModelViewSet):
     filterset_fields = ["century"]
     ordering_fields = ["name", "century", "id"]
     ordering = ["name"]
+    list_values = ("id", "name", "century", "image", "image_slug")
+    list_expressions = {"poems_count": F("poems_count_ann")}
+
+    def get_queryset(self):
+        """
+        Annotate the poem counts of the list in one query. Poet detail reads
+        its counts from the cache instead (see GanjoorPoet.counts).
+        """
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.annotate(
+                poems_count_ann=Coalesce(Sum("categories__poem_count"), 0)
+            )
+        return queryset
+
+    @catalog_condition
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -329,41 +513,46 @@ class GanjoorPoetViewSet(viewsets.ModelViewSet):
             return GanjoorPoetListSerializer
         return GanjoorPoetSerializer
 
+    def list_rows(self, rows):
+        """Turn stored image names into absolute URLs, as ImageField does."""
+        storage = GanjoorPoet._meta.get_field("image").storage
+        context = self.get_serializer_context()
+        for row in rows:
+            if row["image"]:
+                row["image"] = absolute_url(context, storage.url(row["image"]))
+            else:
+                row["image"] = None
+        return rows
+
     @action(detail=True, methods=["get"])
     def categories(self, request, pk=None):
         """Get all categories for a specific poet."""
         poet = self.get_object()
-        categories = poet.categories.filter(parent=None).order_by("title")
-        serializer = GanjoorCategoryListSerializer(
-            categories, many=True, context={"request": request}
-        )
-        return Response(serializer.data)
 
-    @action(detail=True, methods=["get"])
+        def serialize_categories():
+            categories = (
+                poet.categories.filter(parent=None)
+                .for_list()
+                .with_poems_count()
+                .order_by("title")
+            )
+            serializer = GanjoorCategoryListSerializer(
+                categories, many=True, context={"request": request}
+            )
+            return list(serializer.data)
+
+        key = f"poet:{poet.pk}:categories:{catalog_last_modified().timestamp()}"
+        return Response(cache.get_or_set(key, serialize_categories, 60 * 60))
+
+    @action(detail=True, methods=["get"], pagination_class=PoemCursorPagination)
     def poems(self, request, pk=None):
         """Get all poems for a specific poet."""
         poet = self.get_object()
-        poems = (
-            GanjoorPoem.objects.select_related("category__poet")
-            .filter(category__poet=poet)
-            .order_by("title")
-        )
-
-        # Apply pagination
-        page = self.paginate_queryset(poems)
-        if page is not None:
-            serializer = GanjoorPoemListSerializer(
-                page, many=True, context={"request": request}
-            )
-            return self.get_paginated_response(serializer.data)
+        poems = GanjoorPoem.objects.filter(category__poet=poet)
+        return poem_list_response(self, poems)
 
-        serializer = GanjoorPoemListSerializer(
-            poems, many=True, context={"request": request}
-        )
-        return Response(serializer.data)
 
-
-class GanjoorCategoryViewSet(viewsets.ModelViewSet):
+class GanjoorCategoryViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing categories.
 
@@ -381,6 +570,23 @@ class GanjoorCategoryViewSet(viewsets.ModelViewSet):
     filterset_fields = ["poet", "parent"]
     ordering_fields = ["title", "id"]
     ordering = ["title"]
+    list_values = ("id", "title", "url", "poet", "parent")
+    list_expressions = {
+        "poet_name": F("poet__name"),
+        "parent_title": F("parent__title"),
+        "poems_count": F("poems_count_ann"),
+    }
+
+    def get_queryset(self):
+        """Annotate the subtree poem counts shown by the serializers."""
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.with_poems_count()
+        return queryset
+
+    @catalog_condition
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -388,30 +594,17 @@ class GanjoorCategoryViewSet(viewsets.ModelViewSet):
             return GanjoorCategoryListSerializer
         return GanjoorCategorySerializer
 
-    @action(detail=True, methods=["get"])
+    @action(detail=True, methods=["get"], pagination_class=PoemCursorPagination)
     def poems(self, request, pk=None):
         """Get all poems in a specific category."""
         category = self.get_object()
-        poems = category.poems.select_related("category__poet").order_by("title")
-
-        # Apply pagination
-        page = self.paginate_queryset(poems)
-        if page is not None:
-            serializer = GanjoorPoemListSerializer(
-                page, many=True, context={"request": request}
-            )
-            return self.get_paginated_response(serializer.data)
-
-        serializer = GanjoorPoemListSerializer(
-            poems, many=True, context={"request": request}
-        )
-        return Response(serializer.data)
+        return poem_list_response(self, category.poems.all())
 
     @action(detail=True, methods=["get"])
     def subcategories(self, request, pk=None):
         """Get all subcategories of a specific category."""
         category = self.get_object()
-        subcategories = category.children.all().order_by("title")
+        subcategories = category.children.for_list().with_poems_count().order_by("title")
         serializer = GanjoorCategoryListSerializer(
             subcategories, many=True, context={"request": request}
         )
@@ -425,14 +618,19 @@ class GanjoorPoemViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for poems with filtering and search.
     """
 
-    queryset = GanjoorPoem.objects.all().select_related("category__poet")
+    # The search columns hold the whole text of the poem and are never shown
+    queryset = GanjoorPoem.objects.select_related("category__poet").defer(
+        "search_corpus", "search_vec", "category__poet__description"
+    )
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    search_fields = ["title", "verses__text"]
+    # search_corpus holds the text of every verse, so matching poems are
+    # found without joining the verses and de-duplicating with DISTINCT
+    search_fields = ["title", "search_corpus"]
     filterset_fields = ["category", "category__poet"]
     ordering_fields = ["title", "id"]
     ordering = ["title"]
@@ -447,9 +645,29 @@ class GanjoorPoemViewSet(viewsets.ModelViewSet):
         """Optimize queryset with prefetch_related for verses."""
         queryset = super().get_queryset()
         if self.action == "retrieve":
-            queryset = queryset.prefetch_related("verses", "audios")
+            # Only prefetch the relations selected by ?fields= / ?omit=
+            if is_field_requested(self.request, "verses"):
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        "verses",
+                        queryset=GanjoorVerse.objects.only(
+                            "id", "poem_id", "order", "position", "text"
+                        ).order_by("order"),
+                    )
+                )
+            if is_field_requested(self.request, "audios"):
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        "audios",
+                        queryset=GanjoorPoemAudio.objects.filter(is_uploaded=True),
+                        to_attr="uploaded_audios",
+                    )
+                )
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        return poem_list_response(self, self.filter_queryset(self.get_queryset()))
+
     @action(detail=True, methods=["get"])
     def verses(self, request, pk=None):
         """Get all verses for a specific poem."""
@@ -481,35 +699,20 @@ class GanjoorPoemViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        queryset = self.get_queryset()
+        # Search in title and verses, optionally for one poet
+        queryset = GanjoorPoem.objects.search(query, poet_id)
+        return poem_list_response(self, queryset)
 
-        # Filter by poet if specified
-        if poet_id:
-            queryset = queryset.filter(category__poet_id=poet_id)
-
-        # Search in title and verses
-        queryset = queryset.filter(
-            Q(title__icontains=query) | Q(verses__text__icontains=query)
-        ).distinct()
-
-        # Apply pagination
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-
-class GanjoorVerseViewSet(viewsets.ModelViewSet):
+class GanjoorVerseViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing verses.
 
     Provides CRUD operations for verses with filtering.
     """
 
-    queryset = GanjoorVerse.objects.all().select_related("poem")
+    # The serializer only shows the poem id, no join needed
+    queryset = GanjoorVerse.objects.all()
     serializer_class = GanjoorVerseSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [
@@ -522,8 +725,14 @@ class GanjoorVerseViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order", "id"]
     ordering = ["order"]
 
+    def perform_create(self, serializer):
+        save_unique(serializer)
+
+    def perform_update(self, serializer):
+        save_unique(serializer)
+
 
-class GanjoorFavoriteViewSet(viewsets.ModelViewSet):
+class GanjoorFavoriteViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing user favorites.
 
@@ -539,13 +748,27 @@ class GanjoorFavoriteViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only the current user's favorites."""
-        return GanjoorFavorite.objects.filter(user=self.request.user).select_related(
-            "poem__category__poet", "verse"
+        queryset = (
+            GanjoorFavorite.objects.filter(user=self.request.user)
+            .select_related("user", "poem__category__poet", "verse")
+            .defer("poem__search_corpus", "poem__search_vec")
         )
+        if self.action == "list":
+            # Only the columns the serializer shows, plus the foreign keys
+            # that join the related rows
+            queryset = queryset.only(
+                "id",
+                "created_at",
+                "user__username",
+                "poem__title",
+                "poem__category__poet__name",
+                "verse__text",
+            )
+        return queryset
 
     def perform_create(self, serializer):
         """Automatically set the user when creating a favorite."""
-        serializer.save(user=self.request.user)
+        save_unique(serializer, user=self.request.user)
 
     @action(detail=False, methods=["post"])
     def toggle(self, request):
@@ -568,11 +791,8 @@ class GanjoorFavoriteViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            favorite = GanjoorFavorite.objects.get(
-                user=request.user, poem_id=poem_id, verse_id=verse_id
-            )
-            favorite.delete()
+        # One DELETE both checks for and removes an existing favorite
+        if GanjoorFavorite.remove(request.user.pk, poem_id, verse_id):
             return Response(
                 {
                     "status": "removed",
@@ -580,18 +800,18 @@ class GanjoorFavoriteViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_200_OK,
             )
-        except GanjoorFavorite.DoesNotExist:
-            serializer = self.get_serializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
-            return Response(
-                {
-                    "status": "added",
-                    "message": str(_("Added to favorites.")),
-                    "data": serializer.data,
-                },
-                status=status.HTTP_201_CREATED,
-            )
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return Response(
+            {
+                "status": "added",
+                "message": str(_("Added to favorites.")),
+                "data": serializer.data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class GanjoorPoemAudioViewSet(viewsets.ModelViewSet):
@@ -601,7 +821,10 @@ class GanjoorPoemAudioViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for audio files with filtering.
     """
 
-    queryset = GanjoorPoemAudio.objects.all().select_related("poem")
+    # Only the poem title is shown; skip the poem's search columns
+    queryset = GanjoorPoemAudio.objects.select_related("poem").defer(
+        "poem__search_corpus", "poem__search_vec"
+    )
     serializer_class = GanjoorPoemAudioSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -617,7 +840,10 @@ class GanjoorAudioSyncViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for audio sync points.
     """
 
-    queryset = GanjoorAudioSync.objects.all().select_related("poem", "audio")
+    # Only the poem title is shown; skip the poem's search columns
+    queryset = GanjoorAudioSync.objects.select_related("poem").defer(
+        "poem__search_corpus", "poem__search_vec"
+    )
     serializer_class = GanjoorAudioSyncSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -625,6 +851,13 @@ class GanjoorAudioSyncViewSet(viewsets.ModelViewSet):
     ordering_fields = ["verse_order", "millisec"]
     ordering = ["verse_order"]
 
+    def get_queryset(self):
+        """Annotate the text of each synced verse in the same query."""
+        verse_text = GanjoorVerse.objects.filter(
+            poem=OuterRef("poem"), order=OuterRef("verse_order")
+        ).values("text")[:1]
+        return super().get_queryset().annotate(verse_text_ann=Subquery(verse_text))
+
 
 class UserSettingViewSet(viewsets.ModelViewSet):
     """
@@ -653,7 +886,7 @@ class UserSettingViewSet(viewsets.ModelViewSet):
         POST: Updates current user's settings
         """
         try:
-            settings = UserSetting.objects.get(user=request.user)
+            settings = UserSetting.get_for_user(request.user)
         except UserSetting.DoesNotExist:
             if request.method == "GET":
                 return Response(
@@ -1,28 +1,42 @@
 """
 Ganjoor Django Application Initialization
 
-This module initializes the Django application and optionally sets up
-OpenTelemetry tracing if the required packages are installed.
+OpenTelemetry tracing is optionally set up by ``setup_telemetry()`` if the
+required packages are installed. It is called by the WSGI and ASGI entry
+points rather than at import time, so that management commands (migrate,
+shell, test) do not start exporters, and so that each gunicorn worker sets
+up its own exporter threads after the fork instead of inheriting the
+master's.
 """
 
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
-# Try to initialize OpenTelemetry tracing if available
-try:
-    from .tracing import init_telemetry
-
-    init_telemetry()
-    logger.info("OpenTelemetry tracing initialized successfully")
-except ImportError as e:
-    logger.warning(
-        "OpenTelemetry packages not found. Tracing is disabled. "
-        "Install opentelemetry packages to enable distributed tracing. "
-        f"Error: {e}"
-    )
-except Exception as e:
-    logger.error(
-        f"Failed to initialize OpenTelemetry tracing: {e}. "
-        "Continuing without tracing..."
-    )
+
+def setup_telemetry():
+    """
+    Initialize OpenTelemetry tracing if available.
+
+    Setting DJANGO_DISABLE_TELEMETRY skips it.
+    """
+    if os.environ.get("DJANGO_DISABLE_TELEMETRY"):
+        return
+
+    try:
+        from .tracing import init_telemetry
+
+        if init_telemetry():
+            logger.info("OpenTelemetry tracing initialized successfully")
+    except ImportError as e:
+        logger.warning(
+            "OpenTelemetry packages not found. Tracing is disabled. "
+            "Install opentelemetry packages to enable distributed tracing. "
+            f"Error: {e}"
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to initialize OpenTelemetry tracing: {e}. "
+            "Continuing without tracing..."
+        )
@@ -7,11 +7,16 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
-# ganjoor/wsgi.py
 import os
 
-from django.core.wsgi import get_wsgi_application
+from django.core.asgi import get_asgi_application
+
+from ganjoor import setup_telemetry
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ganjoor.settings')
 
-application = get_wsgi_application()
+# Before the application loads its middleware, which Django
+# instrumentation extends
+setup_telemetry()
+
+application = get_asgi_application()
@@ -2,25 +2,95 @@
 OpenTelemetry Configuration for Ganjoor Django Application
 
 This module sets up complete observability with traces and metrics for the Ganjoor poetry application.
-Logging instrumentation is handled by Django's logging configuration.
+Logging instrumentation is handled by Django's logging configuration; OpenTelemetry log
+export is opt-in.
+
+Each signal is switched by an environment flag: OTEL_TRACES_ENABLED and
+OTEL_METRICS_ENABLED (default true), OTEL_LOGS_ENABLED (default false).
 """
 
 import os
 import logging
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.semconv.resource import ResourceAttributes
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk._logs import LoggerProvider
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
-from opentelemetry.instrumentation.django import DjangoInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry import trace, metrics
+import signal
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+# Set once the providers are installed; a second call (both entry points
+# imported, autoreload, tests) would otherwise add another set of exporter
+# threads and duplicate every span
+_INITIALIZED = False
+
+
+def _env_int(name, default):
+    """Read an integer setting from the environment."""
+    return int(os.environ.get(name, default))
+
+
+def _env_flag(name, default):
+    """Read a true/false setting from the environment."""
+    return os.environ.get(name, str(default)).lower() == "true"
+
+
+# Requests that are not traced: the OpenAPI schema and Swagger UI (polled by
+# API clients), static and media files, the favicon and the admin's jsi18n.
+# Patterns are searched in the request URL; OTEL_PYTHON_DJANGO_EXCLUDED_URLS
+# replaces the list.
+EXCLUDED_URLS = "/api/schema/,/static/,/media/,/favicon.ico,/jsi18n/"
+
+
+# Request span attributes dropped by _scrub_request_span(), and the URL
+# attributes whose query string it cuts
+SCRUBBED_ATTRIBUTES = ("http.user_agent", "http.client_ip", "net.peer.ip", "net.peer.port")
+URL_ATTRIBUTES = ("http.url", "http.target")
+
+
+def _scrub_request_span(span, request):
+    """
+    Request hook of the Django instrumentation: drop high-cardinality
+    attributes from the request span before it is exported.
+
+    The client address and user agent are left out, and query strings are
+    cut from URLs (they carry search terms and page numbers), so spans are
+    smaller to export and the backend indexes fewer distinct values. The
+    hook runs once the middleware has set all request attributes.
+    """
+    if not span.is_recording():
+        return
+    # The SDK has no public way to remove an attribute
+    attributes = span._attributes
+    for key in SCRUBBED_ATTRIBUTES:
+        attributes.pop(key, None)
+    for key in URL_ATTRIBUTES:
+        url = attributes.get(key)
+        if url and "?" in url:
+            attributes[key] = urlunsplit(urlsplit(url)._replace(query=""))
+
+
+def _flush_on_sigterm(providers):
+    """
+    Flush the providers' buffered spans, metrics and logs when the process
+    gets SIGTERM.
+
+    The providers already flush at exit, but a process killed by SIGTERM's
+    default action never gets there. Servers that handle SIGTERM themselves
+    (gunicorn, uvicorn) exit normally, so their handler is left alone.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+
+    def handle_sigterm(signum, frame):
+        for provider in providers:
+            provider.force_flush(timeout_millis=2000)
+        # Terminate the way the default action would have
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
 
 
 def init_telemetry():
@@ -31,36 +101,138 @@ def init_telemetry():
     - Distributed tracing (HTTP requests, database operations, Django operations)
     - Metrics collection (request rates, response times, error rates)
     - Automatic instrumentation for all configured packages
+
+    Only the first call in a process has any effect, and none if
+    OTEL_SDK_DISABLED is true; returns whether this call set telemetry up.
     """
-    otlp_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    global _INITIALIZED
+    if _INITIALIZED:
+        return False
+    if _env_flag("OTEL_SDK_DISABLED", False):
+        return False
+    _INITIALIZED = True
+
+    # The SDK, exporters and protobuf are imported here rather than at
+    # module level, so processes that never set telemetry up do not load them
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.semconv.resource import ResourceAttributes
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+    from opentelemetry.sdk.metrics.export import (
+        AggregationTemporality,
+        PeriodicExportingMetricReader,
+    )
+    from opentelemetry.exporter.otlp.proto.http import Compression
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.instrumentation.django import DjangoInstrumentor
+    from opentelemetry import trace, metrics
+
+    # Signals are exported as OTLP over HTTP/protobuf. The exporters read
+    # OTEL_EXPORTER_OTLP_ENDPOINT (default http://localhost:4318) themselves
+    # and append the /v1/traces, /v1/metrics and /v1/logs paths to it; each
+    # keeps its connection to the collector open in a requests session.
+
+    # Exports are gzipped unless OTEL_EXPORTER_OTLP_COMPRESSION says
+    # otherwise; the repeated attribute keys of spans compress well
+    compression = None
+    if "OTEL_EXPORTER_OTLP_COMPRESSION" not in os.environ:
+        compression = Compression.Gzip
 
     resource = Resource.create({
         ResourceAttributes.SERVICE_NAME: "ganjoor-django",
         ResourceAttributes.SERVICE_VERSION: "1.0.0",
     })
 
-    # Initialize tracing
-    span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-    tracer_provider = TracerProvider(resource=resource)
-    tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
-    trace.set_tracer_provider(tracer_provider)
+    traces_enabled = _env_flag("OTEL_TRACES_ENABLED", True)
+    metrics_enabled = _env_flag("OTEL_METRICS_ENABLED", True)
+    # Off by default: LoggingInstrumentor wraps the creation of every log
+    # record to look up the current span
+    logs_enabled = _env_flag("OTEL_LOGS_ENABLED", False)
+
+    providers = []
+    tracer_provider = None
+    if traces_enabled:
+        # Only a share of root traces is recorded (5% by default,
+        # OTEL_TRACES_SAMPLER_ARG); child spans follow their parent's
+        # decision, so sampled traces stay complete. Unsampled requests get
+        # non-recording spans that are never exported. Setting
+        # OTEL_TRACES_SAMPLER hands the choice back to the SDK's standard
+        # environment configuration; tail sampling belongs in the collector.
+        sampler = None
+        if "OTEL_TRACES_SAMPLER" not in os.environ:
+            ratio = float(os.environ.get("OTEL_TRACES_SAMPLER_ARG", "0.05"))
+            sampler = ParentBased(root=TraceIdRatioBased(ratio))
+        span_exporter = OTLPSpanExporter(compression=compression)
+        tracer_provider = TracerProvider(resource=resource, sampler=sampler)
+        # Larger, less frequent batches than the SDK defaults (2048/512/5s):
+        # fewer export RPCs, and bursts fill the queue before spans are
+        # dropped. The standard OTEL_BSP_* variables still override them.
+        tracer_provider.add_span_processor(BatchSpanProcessor(
+            span_exporter,
+            max_queue_size=_env_int("OTEL_BSP_MAX_QUEUE_SIZE", 8192),
+            max_export_batch_size=_env_int("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 2048),
+            schedule_delay_millis=_env_int("OTEL_BSP_SCHEDULE_DELAY", 10000),
+            export_timeout_millis=_env_int("OTEL_BSP_EXPORT_TIMEOUT", 30000),
+        ))
+        trace.set_tracer_provider(tracer_provider)
+        providers.append(tracer_provider)
+
+    if metrics_enabled:
+        # Counters and histograms report only the change since the last
+        # export instead of their whole cumulative state, unless
+        # OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE says otherwise
+        temporality = None
+        if "OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE" not in os.environ:
+            temporality = {
+                Counter: AggregationTemporality.DELTA,
+                Histogram: AggregationTemporality.DELTA,
+            }
+        metric_exporter = OTLPMetricExporter(
+            compression=compression, preferred_temporality=temporality
+        )
+        metric_reader = PeriodicExportingMetricReader(
+            exporter=metric_exporter,
+            export_interval_millis=_env_int("OTEL_METRIC_EXPORT_INTERVAL", 60000),
+            export_timeout_millis=_env_int("OTEL_METRIC_EXPORT_TIMEOUT", 30000),
+        )
+        meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
+        metrics.set_meter_provider(meter_provider)
+        providers.append(meter_provider)
 
-    # Initialize metrics
-    metric_exporter = OTLPMetricExporter(endpoint=otlp_endpoint)
-    metric_reader = PeriodicExportingMetricReader(exporter=metric_exporter)
-    meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
-    metrics.set_meter_provider(meter_provider)
+    if logs_enabled:
+        # The logs SDK is only imported when it is used
+        from opentelemetry.sdk._logs import LoggerProvider
+        from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+        from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+        from opentelemetry.instrumentation.logging import LoggingInstrumentor
 
-    # Initialize logs
-    log_exporter = OTLPLogExporter(endpoint=otlp_endpoint)
-    logger_provider = LoggerProvider(resource=resource)
-    logger_provider.add_log_record_processor(BatchLogRecordProcessor(log_exporter))
+        log_exporter = OTLPLogExporter(compression=compression)
+        logger_provider = LoggerProvider(resource=resource)
+        logger_provider.add_log_record_processor(BatchLogRecordProcessor(
+            log_exporter,
+            max_queue_size=_env_int("OTEL_BLRP_MAX_QUEUE_SIZE", 8192),
+            max_export_batch_size=_env_int("OTEL_BLRP_MAX_EXPORT_BATCH_SIZE", 2048),
+            schedule_delay_millis=_env_int("OTEL_BLRP_SCHEDULE_DELAY", 10000),
+            export_timeout_millis=_env_int("OTEL_BLRP_EXPORT_TIMEOUT", 30000),
+        ))
+        # Instrument logging to send logs to OpenTelemetry
+        LoggingInstrumentor().instrument(logger_provider=logger_provider, set_logging_format=False)
+        providers.append(logger_provider)
 
-    # Instrument Django (automatically instruments many libraries)
-    DjangoInstrumentor().instrument(tracer_provider=tracer_provider)
+    # Instrument Django (automatically instruments many libraries); it
+    # records both request spans and request metrics
+    django_instrumentor = DjangoInstrumentor()
+    if (traces_enabled or metrics_enabled) and not django_instrumentor.is_instrumented_by_opentelemetry:
+        django_instrumentor.instrument(
+            tracer_provider=tracer_provider,
+            request_hook=_scrub_request_span,
+            excluded_urls=os.environ.get("OTEL_PYTHON_DJANGO_EXCLUDED_URLS", EXCLUDED_URLS),
+        )
 
-    # Instrument logging to send logs to OpenTelemetry
-    LoggingInstrumentor().instrument(logger_provider=logger_provider, set_logging_format=False)
+    _flush_on_sigterm(providers)
 
     # Configure Python logging with structured output
     root_logger = logging.getLogger()
@@ -75,4 +247,14 @@ def init_telemetry():
         root_logger.addHandler(console_handler)
         root_logger.setLevel(logging.INFO)
 
-    print("✅ OpenTelemetry initialized: traces, metrics, and logs enabled")
+    signals = [
+        name
+        for name, enabled in (
+            ("traces", traces_enabled),
+            ("metrics", metrics_enabled),
+            ("logs", logs_enabled),
+        )
+        if enabled
+    ]
+    logger.info("OpenTelemetry initialized: %s enabled", ", ".join(signals) or "no signals")
+    return True
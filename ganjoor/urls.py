@@ -3,12 +3,25 @@ from django.urls import include, path
 from django.conf.urls.i18n import i18n_patterns
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.static import serve
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
-# Non-translatable URLs (API and admin)
-urlpatterns = [
+# Translatable URLs (with language prefix). They come first: most requests
+# are for the site pages, and the resolver tries patterns in order. None of
+# them overlaps the API paths below, so the order does not change routing.
+urlpatterns = i18n_patterns(
+    path("admin/", admin.site.urls),
+    path("", include("core.urls", namespace="core")),
+    prefix_default_language=False,  # Don't add prefix for default language
+)
+
+# Non-translatable URLs (API)
+urlpatterns += [
     path("api/", include("core.api_urls")),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    # The schema only changes with a deploy; building it walks every viewset
+    # and serializer, and Swagger UI fetches it on each load
+    path("api/schema/", cache_page(3600)(SpectacularAPIView.as_view()), name="schema"),
     path(
         "api/schema/swagger-ui/",
         SpectacularSwaggerView.as_view(url_name="schema"),
@@ -16,14 +29,14 @@ urlpatterns = [
     ),
 ]
 
-# Translatable URLs (with language prefix)
-urlpatterns += i18n_patterns(
-    path("admin/", admin.site.urls),
-    path("", include("core.urls", namespace="core")),
-    prefix_default_language=False,  # Don't add prefix for default language
-)
-
-# Serve media files in development
+# Serve media files in development. Browsers may reuse them for an hour
+# instead of revalidating each one on every page load; the tracing
+# instrumentation already skips these URLs.
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+    cached_serve = cache_control(max_age=3600)(serve)
+    urlpatterns += static(
+        settings.MEDIA_URL, view=cached_serve, document_root=settings.MEDIA_ROOT
+    )
+    urlpatterns += static(
+        settings.STATIC_URL, view=cached_serve, document_root=settings.STATIC_ROOT
+    )
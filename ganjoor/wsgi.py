@@ -11,6 +11,12 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from ganjoor import setup_telemetry
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ganjoor.settings')
 
+# Before the application loads its middleware, which Django
+# instrumentation extends
+setup_telemetry()
+
 application = get_wsgi_application()